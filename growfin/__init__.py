@@ -1,5 +1,11 @@
+import logging
+
 from .ticker import Ticker
 from .api import *
+from .aapi import *
 from .utils import *
 from .utils_info import *
 from .constants import *
+
+# Library logging stays silent unless the application configures the "growfin" logger
+logging.getLogger(__name__).addHandler(logging.NullHandler())
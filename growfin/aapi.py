@@ -0,0 +1,75 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict
+from .api import call_price_api, call_nse_api, api_info, api_news, api_events
+
+
+# Matches the shared session's pool_maxsize so every worker can hold a warm connection
+_MAX_WORKERS = 20
+
+_executor = None
+_executor_pid = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the thread pool backing the async wrappers, creating it on first use."""
+    global _executor, _executor_pid
+
+    pid = os.getpid()
+    if _executor is not None and _executor_pid == pid:
+        return _executor
+
+    with _executor_lock:
+        if _executor is None or _executor_pid != pid:
+            _executor = ThreadPoolExecutor(max_workers=_MAX_WORKERS, thread_name_prefix="growfin")
+            _executor_pid = pid
+
+    return _executor
+
+
+async def _run(func, *args, **kwargs):
+    """Run a blocking API helper on the shared pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), partial(func, *args, **kwargs))
+
+
+async def acall_price_api(
+    ticker: str,
+    start: int,
+    end: int,
+    interval: int,
+    debug: bool = False,
+    use_cache: bool = True
+) -> Dict:
+    """
+    Async variant of `call_price_api`.
+
+    Many calls can be awaited together, e.g.
+    `await asyncio.gather(*[acall_price_api(...) for batch in batches])`,
+    and they share the pooled keep-alive connections of the sync helpers.
+    """
+    return await _run(call_price_api, ticker, start, end, interval, debug=debug, use_cache=use_cache)
+
+
+async def acall_nse_api(ticker: str, debug: bool = False) -> dict:
+    """Async variant of `call_nse_api`."""
+    return await _run(call_nse_api, ticker, debug=debug)
+
+
+async def aapi_info(search_id: str, debug: bool = False) -> dict:
+    """Async variant of `api_info`."""
+    return await _run(api_info, search_id, debug=debug)
+
+
+async def aapi_news(groww_company_id: str, page: int = 0, size: int = 10, debug: bool = False) -> dict:
+    """Async variant of `api_news`."""
+    return await _run(api_news, groww_company_id, page=page, size=size, debug=debug)
+
+
+async def aapi_events(groww_company_id: str, debug: bool = False) -> dict:
+    """Async variant of `api_events`."""
+    return await _run(api_events, groww_company_id, debug=debug)
@@ -1,87 +1,525 @@
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 import requests
-from typing import Dict
-from .constants import hist_url, nse_url, info_url, news_url, events_url
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from .constants import (
+    hist_url, nse_url, info_url, news_url, events_url, HTTP_HEADERS,
+    DEFAULT_TIMEOUT, RETRY_TOTAL, RETRY_BACKOFF_FACTOR, RETRY_STATUS_FORCELIST, INVALID_ID_STATUSES,
+    SEARCH_CACHE_TTL, INFO_CACHE_TTL, CLOSED_CANDLES_CACHE_TTL, OPEN_CANDLES_CACHE_TTL,
+    NEWS_CACHE_TTL, EVENTS_CACHE_TTL,
+    DISK_CACHE_DIR, DISK_CACHE_MAX_BYTES, IST_UTC_OFFSET_SECONDS, MARKET_OPEN_IST_SECONDS
+)
+from .cache import TTLCache, FileCache
+
+try:
+    import orjson
+    _parse_json = orjson.loads
+except ImportError:  # orjson is an optional speed-up; stdlib json also accepts raw bytes
+    _parse_json = json.loads
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; without it streamed responses are parsed in one go
+    ijson = None
+
+
+# Every content coding urllib3 can decode here: gzip/deflate always, br when the
+# optional brotli package is installed. Requests decompress these transparently.
+_ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
+# Default headers of the shared session, built once at import; requests merges them
+# into each request instead of every helper passing its own headers dict
+_SESSION_HEADERS = {**HTTP_HEADERS, "Accept-Encoding": _ACCEPT_ENCODING}
+
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """
+    Return the shared HTTP session used by every API helper, creating it on first use.
 
+    All endpoints live on the same Groww host, so a single keep-alive session lets
+    repeated calls skip the TCP/TLS handshake. The session is rebuilt after a fork
+    so child processes never reuse the parent's pooled sockets.
+    """
+    global _session, _session_pid
+
+    pid = os.getpid()
+    if _session is not None and _session_pid == pid:
+        return _session
+
+    with _session_lock:
+        if _session is None or _session_pid != pid:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=20,
+                max_retries=Retry(
+                    total=RETRY_TOTAL,
+                    backoff_factor=RETRY_BACKOFF_FACTOR,
+                    status_forcelist=RETRY_STATUS_FORCELIST,
+                    allowed_methods=frozenset({"GET"})
+                )
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(_SESSION_HEADERS)
+            _session = session
+            _session_pid = pid
+
+    return _session
+
+
+def close_session() -> None:
+    """
+    Close the shared HTTP session and its pooled connections.
 
-def call_price_api(
-    ticker: str,
-    start: int,
-    end: int,
-    interval: int,
-    debug: bool = False
+    Safe to call at any time (e.g. at interpreter shutdown or between tests); the
+    next API call simply opens a fresh session.
+    """
+    global _session, _session_pid
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+        _session_pid = None
+
+
+# Fixed query parameters; each call only adds or copies on top of these
+_NSE_PARAMS = {
+    "entity_type": "stocks",
+    "page": 0,
+    "size": 6,
+    "web": "false"
+}
+_INFO_PARAMS = {
+    "fields": "COMPANY_HEADER,STATIC_PRICE",
+    "page": 1,
+    "size": 10
+}
+
+# Non-debug responses are cached; debug calls always hit the network so their logs stay real
+_search_cache = TTLCache(maxsize=1024, ttl=SEARCH_CACHE_TTL)
+_info_cache = TTLCache(maxsize=1024, ttl=INFO_CACHE_TTL)
+_price_cache = TTLCache(maxsize=1024, ttl=CLOSED_CANDLES_CACHE_TTL)
+_news_cache = TTLCache(maxsize=1024, ttl=NEWS_CACHE_TTL)
+_events_cache = TTLCache(maxsize=1024, ttl=EVENTS_CACHE_TTL)
+
+
+def _disk_cache(name: str, ttl: Optional[float] = None) -> Optional[FileCache]:
+    """On-disk cache in its own subdirectory of DISK_CACHE_DIR, or None when disabled."""
+    if not DISK_CACHE_DIR:
+        return None
+    return FileCache(os.path.join(DISK_CACHE_DIR, name), max_bytes=DISK_CACHE_MAX_BYTES, ttl=ttl)
+
+
+_candle_disk_cache = _disk_cache("candles")
+_news_disk_cache = _disk_cache("news", ttl=NEWS_CACHE_TTL)
+_events_disk_cache = _disk_cache("events", ttl=EVENTS_CACHE_TTL)
+
+
+def clear_api_cache(disk: bool = False) -> None:
+    """Drop every in-process cached API response, and the on-disk caches if `disk` is True."""
+    for cache in (_search_cache, _info_cache, _price_cache, _news_cache, _events_cache):
+        cache.clear()
+    if disk:
+        for cache in (_candle_disk_cache, _news_disk_cache, _events_disk_cache):
+            if cache is not None:
+                cache.clear()
+
+
+def forget_api_lookup(ticker: Optional[str] = None, search_id: Optional[str] = None) -> None:
+    """Drop the cached search response for `ticker` and the cached company info for `search_id`."""
+    if ticker:
+        _search_cache.pop(ticker)
+        _search_cache.pop(ticker.upper())
+    if search_id:
+        _info_cache.pop(search_id)
+
+
+def _detached(result: Dict) -> Dict:
+    """
+    Copy of a cached or shared envelope that the caller may modify freely.
+
+    The envelope, its `data` dict and that dict's list/dict values (e.g. `candles`)
+    are copied; objects nested deeper, such as individual candles, stay shared.
+    """
+    data = result["data"]
+    if isinstance(data, dict):
+        data = {key: value.copy() if isinstance(value, (list, dict)) else value for key, value in data.items()}
+    return {**result, "data": data}
+
+
+def _cached_call(
+    key: Tuple,
+    memory: TTLCache,
+    disk: Optional[FileCache],
+    call: Callable[[], Dict],
+    ttl: Optional[float] = None,
+    persist: Optional[Callable[[Dict], bool]] = None
 ) -> Dict:
     """
-    Calls the Groww candle API and returns the raw JSON response in a consistent format.
+    Serve a non-debug envelope from the in-process cache, then the disk cache, else
+    run `call()` and store its data in both layers when it succeeded.
 
-    Parameters:
-    - ticker (str): NSE stock symbol or Groww-compliant identifier (e.g., 'RELIANCE')
-    - start (int): Start time in epoch milliseconds (UTC)
-    - end (int): End time in epoch milliseconds (UTC)
-    - interval (int): Candle interval in minutes (e.g., 1, 15, 60)
-    - debug (bool): If True, includes detailed debug logs in the output
+    `ttl` overrides the in-process cache lifetime; `persist(data)`, when given, decides
+    whether a successful response is also written to disk. Every envelope returned is
+    a fresh copy, so callers never modify the cached one.
+    """
+    cached = memory.get(key)
+    if cached is not None:
+        return _detached(cached)
 
-    Returns:
-    - dict: {
-        "data": {...}   # Original API JSON (contains 'candles') if successful, else None
-        "debug_info": [...]  # List of debug logs if debug=True, else None
-        "error": [...]  # List of error messages if request fails, else None
-    }
+    if disk is not None:
+        data = disk.get(key)
+        if data is not None:
+            result = {"data": data, "debug_info": None, "error": None}
+            memory.set(key, result, ttl=ttl)
+            return _detached(result)
+
+    result = call()
+    if result["error"] is None:
+        memory.set(key, result, ttl=ttl)
+        if disk is not None and (persist is None or persist(result["data"])):
+            disk.set(key, result["data"])
+        return _detached(result)
+    return result
+
+
+def _market_open_today_ms() -> int:
+    """Epoch milliseconds of today's NSE market open (09:15 IST)."""
+    ist_now = time.time() + IST_UTC_OFFSET_SECONDS
+    ist_midnight = ist_now - ist_now % 86400
+    return int((ist_midnight + MARKET_OPEN_IST_SECONDS - IST_UTC_OFFSET_SECONDS) * 1000)
+
+
+# Requests currently on the wire, keyed per endpoint and argument
+_inflight: Dict[Tuple, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _single_flight(key: Tuple, func: Callable[[], Dict]) -> Dict:
     """
+    Run `func()` once for all concurrent callers sharing `key`.
 
-    debug_logs = []
+    The first caller performs the request; callers arriving while it is in flight
+    wait for and share its result instead of issuing a duplicate request.
+    """
+    with _inflight_lock:
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = Future()
+            _inflight[key] = future
+
+    if not leader:
+        return future.result()
+
+    try:
+        result = func()
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+# requests formats HTTPError messages as "404 Client Error: Not Found for url: ..."
+_INVALID_ID_ERROR_RE = re.compile(
+    r"\b(?:%s) Client Error\b" % "|".join(str(status) for status in INVALID_ID_STATUSES)
+)
+
+
+def _rejects_id(errors: Optional[List[str]]) -> bool:
+    """
+    True when an envelope's errors include an INVALID_ID_STATUSES answer, i.e. the
+    endpoint rejected the ID; timeouts, 5xx and connection failures return False.
+    """
+    return bool(errors) and any(_INVALID_ID_ERROR_RE.search(error) for error in errors)
+
+
+def _prepared_url(url: str, params: Dict) -> str:
+    """Return the encoded URL requests will send for `url` and `params` (debug logging only)."""
+    return requests.Request("GET", url, params=params).prepare().url
+
+
+def _describe_candles(json_data: Dict) -> List[str]:
+    """Debug lines summarising a candle API response."""
+    if "candles" not in json_data:
+        return []
+    sample = json_data["candles"][:2] if json_data["candles"] else "No candles"
+    return [
+        f"[DEBUG] Candle Count: {len(json_data['candles'])}",
+        f"[DEBUG] Sample Candle Data: {sample}"
+    ]
+
+
+def _describe_news(json_data: Dict) -> List[str]:
+    """Debug lines summarising a news API response."""
+    if isinstance(json_data.get("content"), list):
+        return [f"[DEBUG] Number of news items: {len(json_data['content'])}"]
+    return []
+
+
+def _describe_events(json_data: Dict) -> List[str]:
+    """Debug lines summarising a corporate events API response."""
+    if isinstance(json_data.get("events"), list):
+        return [f"[DEBUG] Number of events: {len(json_data['events'])}"]
+    return []
+
+
+def _call_json(
+    url: str,
+    params: Optional[Dict] = None,
+    *,
+    debug: bool = False,
+    ctx: str = "",
+    inputs: Optional[Dict] = None,
+    error_prefix: Optional[str] = None,
+    describe: Optional[Callable[[Dict], List[str]]] = None
+) -> Dict:
+    """
+    Issue a GET against a Groww endpoint and wrap the parsed JSON in the standard envelope.
+
+    Args:
+        url (str): Endpoint URL
+        params (dict, optional): Query parameters
+        debug (bool): If True, collect debug logs describing the request and response
+        ctx (str): Name of the public function making the call, used in debug logs
+        inputs (dict, optional): Caller arguments echoed into the debug logs
+        error_prefix (str, optional): Prefix for request failure messages
+        describe (callable, optional): Returns extra debug lines about the parsed JSON
+
+    Returns:
+        dict: {
+            "data": {original API response} or None,
+            "debug_info": [...] or None,
+            "error": [...] or None
+        }
+
+    Raises:
+        Never raises exceptions - errors are returned in the response structure
+    """
+    debug_logs = [] if debug else None
 
     if debug:
-        debug_logs.append("[DEBUG] Function: call_price_api")
-        debug_logs.append(f"[DEBUG] Input Arguments:")
-        debug_logs.append(f"  - ticker: {ticker}")
-        debug_logs.append(f"  - start: {start}")
-        debug_logs.append(f"  - end: {end}")
-        debug_logs.append(f"  - interval: {interval}")
-
-    url = f"{hist_url}/{ticker}"  # Ensure `hist_url` is globally defined
-    params = {
-        "startTimeInMillis": start,
-        "endTimeInMillis": end,
-        "intervalInMinutes": interval
-    }
+        debug_logs.append(f"[DEBUG] Function: {ctx}")
+        debug_logs.append("[DEBUG] Input Arguments:")
+        for name, value in (inputs or {}).items():
+            debug_logs.append(f"  - {name}: {value}")
+        debug_logs.append(f"[DEBUG] API URL: {url}")
+        debug_logs.append(f"[DEBUG] Request Parameters: {params}")
+        debug_logs.append(f"[DEBUG] Full URL with params: {_prepared_url(url, params)}")
 
     try:
-        response = requests.get(url, params=params)
+        response = _get_session().get(url, params=params, timeout=DEFAULT_TIMEOUT)
 
         if debug:
-            debug_logs.append(f"[DEBUG] Status Code: {response.status_code}")
-            debug_logs.append(f"[DEBUG] Request URL: {response.url}")
-            debug_logs.append(f"[DEBUG] Response Time: {response.elapsed.total_seconds():.3f}s")
-
-        response.raise_for_status()  # Raises HTTPError for bad responses
+            debug_logs.append(f"[DEBUG] Response Status Code: {response.status_code}")
+            debug_logs.append(f"[DEBUG] Response URL: {response.url}")
+            debug_logs.append(f"[DEBUG] Request Headers: {response.request.headers}")
+            debug_logs.append(f"[DEBUG] Response Headers: {response.headers}")
+            debug_logs.append(f"[DEBUG] Content-Encoding: {response.headers.get('Content-Encoding', 'identity')}")
+            debug_logs.append(f"[DEBUG] Response Time: {response.elapsed.total_seconds():.3f} seconds")
+            debug_logs.append(f"[DEBUG] Response Text (first 500 chars): {response.text[:500]}")
 
-        json_data = response.json()
+        response.raise_for_status()
+        json_data = _parse_json(response.content)
 
         if debug:
-            debug_logs.append(f"[DEBUG] Response JSON Keys: {list(json_data.keys())}")
-            if "candles" in json_data:
-                debug_logs.append(f"[DEBUG] Candle Count: {len(json_data['candles'])}")
-                sample = json_data['candles'][:2] if json_data['candles'] else 'No candles'
-                debug_logs.append(f"[DEBUG] Sample Candle Data: {sample}")
-            debug_logs.append(f"[DEBUG] API call successful")
+            if isinstance(json_data, dict):
+                debug_logs.append(f"[DEBUG] Response JSON Keys: {list(json_data.keys())}")
+                if describe:
+                    debug_logs.extend(describe(json_data))
+            debug_logs.append("[DEBUG] API call successful")
 
         return {
             "data": json_data,
-            "debug_info": debug_logs if debug else None,
+            "debug_info": debug_logs,
+            "error": None
+        }
+
+    except requests.RequestException as e:
+        error_msg = f"{error_prefix}: {e}" if error_prefix else str(e)
+        if debug:
+            debug_logs.append(f"[DEBUG] Request failed with error: {e}")
+            debug_logs.append(f"[DEBUG] Error type: {type(e).__name__}")
+
+    except ValueError as e:
+        error_msg = f"Failed to decode JSON: {e}"
+        if debug:
+            debug_logs.append(f"[DEBUG] JSON decode failed: {e}")
+            debug_logs.append(f"[DEBUG] Error type: {type(e).__name__}")
+
+    except Exception as e:
+        error_msg = f"Unexpected error: {e}"
+        if debug:
+            debug_logs.append(f"[DEBUG] Unexpected error: {e}")
+            debug_logs.append(f"[DEBUG] Error type: {type(e).__name__}")
+
+    return {
+        "data": None,
+        "debug_info": debug_logs,
+        "error": [error_msg]
+    }
+
+
+def _iter_json_items(response: requests.Response, prefix: str) -> Iterator:
+    """Yield the items under the ijson `prefix` of a streamed response, closing it when done."""
+    try:
+        if ijson is not None:
+            # Let urllib3 undo gzip/br before ijson sees the bytes
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, prefix)
+        else:
+            node = _parse_json(response.content)
+            for key in prefix.split(".")[:-1]:
+                node = node.get(key) if isinstance(node, dict) else None
+            yield from (node or [])
+    finally:
+        response.close()
+
+
+def _stream_json_items(
+    url: str,
+    params: Optional[Dict] = None,
+    *,
+    item_prefix: str,
+    debug: bool = False,
+    ctx: str = "",
+    inputs: Optional[Dict] = None,
+    error_prefix: Optional[str] = None
+) -> Dict:
+    """
+    Streaming counterpart of `_call_json`: "data" is an iterator over the JSON items
+    found at `item_prefix` (ijson syntax, e.g. 'content.item') instead of the parsed body.
+
+    Connection and HTTP status errors are reported in the envelope as usual. The body is
+    decoded lazily, so a malformed payload raises while the iterator is being consumed.
+    """
+    debug_logs = [] if debug else None
+
+    if debug:
+        debug_logs.append(f"[DEBUG] Function: {ctx} (streaming)")
+        debug_logs.append("[DEBUG] Input Arguments:")
+        for name, value in (inputs or {}).items():
+            debug_logs.append(f"  - {name}: {value}")
+        debug_logs.append(f"[DEBUG] Full URL with params: {_prepared_url(url, params)}")
+        debug_logs.append(f"[DEBUG] Incremental parser: {'ijson' if ijson is not None else 'none (buffered)'}")
+
+    try:
+        response = _get_session().get(url, params=params, timeout=DEFAULT_TIMEOUT, stream=True)
+
+        if debug:
+            debug_logs.append(f"[DEBUG] Response Status Code: {response.status_code}")
+            debug_logs.append(f"[DEBUG] Content-Encoding: {response.headers.get('Content-Encoding', 'identity')}")
+
+        try:
+            response.raise_for_status()
+        except requests.RequestException:
+            response.close()
+            raise
+
+        return {
+            "data": _iter_json_items(response, item_prefix),
+            "debug_info": debug_logs,
             "error": None
         }
 
     except requests.RequestException as e:
         if debug:
-            debug_logs.append(f"[DEBUG] Request failed: {str(e)}")
-            debug_logs.append(f"[DEBUG] Exception type: {type(e).__name__}")
+            debug_logs.append(f"[DEBUG] Request failed with error: {e}")
+            debug_logs.append(f"[DEBUG] Error type: {type(e).__name__}")
+
         return {
             "data": None,
-            "debug_info": debug_logs if debug else None,
-            "error": [str(e)]
+            "debug_info": debug_logs,
+            "error": [f"{error_prefix}: {e}" if error_prefix else str(e)]
         }
-    
-    
+
+
+def _has_candles(data: Optional[Dict]) -> bool:
+    """Only windows that returned candles go to disk; an empty window may still be filled later."""
+    return isinstance(data, dict) and bool(data.get("candles"))
+
+
+def call_price_api(
+    ticker: str,
+    start: int,
+    end: int,
+    interval: int,
+    debug: bool = False,
+    use_cache: bool = True
+) -> Dict:
+    """
+    Calls the Groww candle API and returns the raw JSON response in a consistent format.
+
+    Parameters:
+    - ticker (str): NSE stock symbol or Groww-compliant identifier (e.g., 'RELIANCE')
+    - start (int): Start time in epoch milliseconds (UTC)
+    - end (int): End time in epoch milliseconds (UTC)
+    - interval (int): Candle interval in minutes (e.g., 1, 15, 60)
+    - debug (bool): If True, includes detailed debug logs in the output
+    - use_cache (bool): If False, always fetch from the API and store nothing
+
+    Returns:
+    - dict: {
+        "data": {...}   # Original API JSON (contains 'candles') if successful, else None
+        "debug_info": [...]  # List of debug logs if debug=True, else None
+        "error": [...]  # List of error messages if request fails, else None
+    }
+
+    Successful non-debug results are cached in-process: for CLOSED_CANDLES_CACHE_TTL
+    seconds once the window has ended, for OPEN_CANDLES_CACHE_TTL seconds while it is
+    still open. Windows that ended before today's market open never change and are
+    also persisted under DISK_CACHE_DIR when they returned candles, so repeated runs
+    are served from disk.
+    Each call returns its own envelope (and `data` containers), so modifying the
+    result never affects the cache.
+    """
+    call = partial(
+        _call_json,
+        f"{hist_url}/{ticker}",
+        {
+            "startTimeInMillis": start,
+            "endTimeInMillis": end,
+            "intervalInMinutes": interval
+        },
+        debug=debug,
+        ctx="call_price_api",
+        inputs={"ticker": ticker, "start": start, "end": end, "interval": interval},
+        describe=_describe_candles
+    )
+    if debug or not use_cache:
+        return call()
+
+    closed = end < time.time() * 1000
+    on_disk = end < _market_open_today_ms()
+    return _cached_call(
+        (ticker, start, end, interval),
+        _price_cache,
+        _candle_disk_cache if on_disk else None,
+        call,
+        ttl=CLOSED_CANDLES_CACHE_TTL if closed else OPEN_CANDLES_CACHE_TTL,
+        persist=_has_candles
+    )
+
+
 def call_nse_api(ticker: str, debug: bool = False) -> dict:
     """
     Calls NSE API to search for stock information.
@@ -91,67 +529,39 @@ def call_nse_api(ticker: str, debug: bool = False) -> dict:
     - debug (bool): If True, returns debug information along with data
 
     Returns:
-    - dict: JSON response from API (with debug info if debug=True)
-    
-    Raises:
-    - RuntimeError: If API call fails (only when debug=False)
-    """
-    debug_logs = []
-    
-    if debug:
-        debug_logs.append(f"[DEBUG] Function: call_nse_api")
-        debug_logs.append(f"[DEBUG] Input Arguments:")
-        debug_logs.append(f"  - ticker: {ticker}")
-        debug_logs.append(f"  - debug: {debug}")
-
-    params = {
-        "entity_type": "stocks",
-        "page": 0,
-        "query": ticker,
-        "size": 6,
-        "web": "false"
+    - dict: {
+        "data": {...}   # Original API JSON (results under data.content) if successful, else None
+        "debug_info": [...]  # List of debug logs if debug=True, else None
+        "error": [...]  # List of error messages if request fails, else None
     }
 
+    Successful non-debug responses are cached in-process for SEARCH_CACHE_TTL seconds,
+    and concurrent non-debug calls for the same ticker share a single request; each
+    caller still gets its own copy of the envelope.
+    """
+    if not debug:
+        cached = _search_cache.get(ticker)
+        if cached is not None:
+            return _detached(cached)
+
+    call = partial(
+        _call_json,
+        nse_url,
+        {**_NSE_PARAMS, "query": ticker},
+        debug=debug,
+        ctx="call_nse_api",
+        inputs={"ticker": ticker, "debug": debug},
+        error_prefix="API call failed"
+    )
+    result = call() if debug else _single_flight(("call_nse_api", ticker), call)
+
     if debug:
-        debug_logs.append(f"[DEBUG] API URL: {nse_url}")
-        debug_logs.append(f"[DEBUG] Request Parameters: {params}")
-        debug_logs.append(f"[DEBUG] Full URL with params: {nse_url}?{'&'.join([f'{k}={v}' for k, v in params.items()])}")
+        return result
+    if result["error"] is None:
+        _search_cache.set(ticker, result)
+    # Shared with concurrent callers and the cache
+    return _detached(result)
 
-    try:
-        response = requests.get(nse_url, params=params)
-        
-        if debug:
-            debug_logs.append(f"[DEBUG] Response Status Code: {response.status_code}")
-            debug_logs.append(f"[DEBUG] Response URL: {response.url}")
-            debug_logs.append(f"[DEBUG] Response Headers: {dict(response.headers)}")
-            debug_logs.append(f"[DEBUG] Response Time: {response.elapsed.total_seconds():.3f} seconds")
-            debug_logs.append(f"[DEBUG] Response Text (first 500 chars): {response.text[:500]}")
-        
-        response.raise_for_status()
-        json_data = response.json()
-        
-        if debug:
-            debug_logs.append(f"[DEBUG] Response JSON Keys: {list(json_data.keys())}")
-            debug_logs.append(f"[DEBUG] API call successful")
-            
-            return {
-                "data": json_data,
-                "debug_info": debug_logs
-            }
-        
-        return json_data
-        
-    except requests.RequestException as e:
-        error_msg = f"API call failed: {e}"
-        if debug:
-            debug_logs.append(f"[DEBUG] Request failed with error: {str(e)}")
-            debug_logs.append(f"[DEBUG] Error type: {type(e).__name__}")
-            return {
-                "data": None,
-                "debug_info": debug_logs,
-                "error": error_msg
-            }
-        raise RuntimeError(error_msg)
 
 def api_info(search_id: str, debug: bool = False) -> dict:
     """
@@ -162,68 +572,51 @@ def api_info(search_id: str, debug: bool = False) -> dict:
         debug (bool): If True, returns debug information along with data
 
     Returns:
-        dict: JSON response from the API (with debug info if debug=True)
+        dict: Consistent JSON response structure:
+        {
+            "data": {original API response} or None,
+            "debug_info": [...] or None,
+            "error": [...] or None
+        }
+
+    Successful non-debug responses are cached in-process for INFO_CACHE_TTL seconds,
+    and concurrent non-debug calls for the same search_id share a single request; each
+    caller still gets its own copy of the envelope.
 
     Raises:
-        RuntimeError: If the API request fails (only when debug=False)
+        Never raises exceptions - errors are returned in the response structure
     """
-    debug_logs = []
-    
-    if debug:
-        debug_logs.append(f"[DEBUG] Function: api_info")
-        debug_logs.append(f"[DEBUG] Input Arguments:")
-        debug_logs.append(f"  - search_id: {search_id}")
-        debug_logs.append(f"  - debug: {debug}")
-
-    url = f"{info_url}/{search_id}"
-    params = {
-        "fields": "COMPANY_HEADER,STATIC_PRICE",
-        "page": 1,
-        "size": 10
-    }
+    if not debug:
+        cached = _info_cache.get(search_id)
+        if cached is not None:
+            return _detached(cached)
+
+    call = partial(
+        _call_json,
+        f"{info_url}/{search_id}",
+        dict(_INFO_PARAMS),
+        debug=debug,
+        ctx="api_info",
+        inputs={"search_id": search_id, "debug": debug},
+        error_prefix="Failed to fetch company info"
+    )
+    result = call() if debug else _single_flight(("api_info", search_id), call)
 
     if debug:
-        debug_logs.append(f"[DEBUG] API URL: {url}")
-        debug_logs.append(f"[DEBUG] Request Parameters: {params}")
-        debug_logs.append(f"[DEBUG] Full URL with params: {url}?{'&'.join([f'{k}={v}' for k, v in params.items()])}")
-
-    try:
-        response = requests.get(url, params=params)
-        
-        if debug:
-            debug_logs.append(f"[DEBUG] Response Status Code: {response.status_code}")
-            debug_logs.append(f"[DEBUG] Response URL: {response.url}")
-            debug_logs.append(f"[DEBUG] Response Headers: {dict(response.headers)}")
-            debug_logs.append(f"[DEBUG] Response Time: {response.elapsed.total_seconds():.3f} seconds")
-            debug_logs.append(f"[DEBUG] Response Text (first 500 chars): {response.text[:500]}")
-        
-        response.raise_for_status()
-        json_data = response.json()
-        
-        if debug:
-            debug_logs.append(f"[DEBUG] Response JSON Keys: {list(json_data.keys())}")
-            debug_logs.append(f"[DEBUG] API call successful")
-            
-            return {
-                "data": json_data,
-                "debug_info": debug_logs
-            }
-        
-        return json_data
-        
-    except requests.RequestException as e:
-        error_msg = f"Failed to fetch company info: {e}"
-        if debug:
-            debug_logs.append(f"[DEBUG] Request failed with error: {str(e)}")
-            debug_logs.append(f"[DEBUG] Error type: {type(e).__name__}")
-            return {
-                "data": None,
-                "debug_info": debug_logs,
-                "error": error_msg
-            }
-        raise RuntimeError(error_msg)
-
-def api_news(groww_company_id: str, page: int = 0, size: int = 10, debug: bool = False) -> dict:
+        return result
+    if result["error"] is None:
+        _info_cache.set(search_id, result)
+    # Shared with concurrent callers and the cache
+    return _detached(result)
+
+
+def api_news(
+    groww_company_id: str,
+    page: int = 0,
+    size: int = 10,
+    debug: bool = False,
+    stream: bool = False
+) -> dict:
     """
     Fetch recent news articles for a company using its Groww ID.
 
@@ -232,76 +625,49 @@ def api_news(groww_company_id: str, page: int = 0, size: int = 10, debug: bool =
         page (int): Page number for pagination
         size (int): Number of results per page
         debug (bool): If True, returns debug information along with data
+        stream (bool): If True, "data" is an iterator over the news items of the page,
+                       decoded incrementally with ijson when installed. Useful for large
+                       `size` values; the iterator must be consumed (or closed) to release
+                       the connection.
 
     Returns:
         dict: Consistent JSON response structure:
         {
-            "data": {original API response} or None,
+            "data": {original API response} (or an iterator of news items if stream=True) or None,
             "debug_info": [...] or None,
             "error": [...] or None
         }
 
+    Successful non-debug, non-streamed responses are cached in-process and on disk
+    for NEWS_CACHE_TTL seconds; each call returns its own copy of the envelope.
+
     Raises:
         Never raises exceptions - errors are returned in the response structure
     """
-    debug_logs = []
-    
+    if stream:
+        return _stream_json_items(
+            f"{news_url}/{groww_company_id}",
+            {"page": page, "size": size},
+            item_prefix="content.item",
+            debug=debug,
+            ctx="api_news",
+            inputs={"groww_company_id": groww_company_id, "page": page, "size": size, "debug": debug},
+            error_prefix="API request failed"
+        )
+
+    call = partial(
+        _call_json,
+        f"{news_url}/{groww_company_id}",
+        {"page": page, "size": size},
+        debug=debug,
+        ctx="api_news",
+        inputs={"groww_company_id": groww_company_id, "page": page, "size": size, "debug": debug},
+        error_prefix="API request failed",
+        describe=_describe_news
+    )
     if debug:
-        debug_logs.append(f"[DEBUG] Function: api_news")
-        debug_logs.append(f"[DEBUG] Input Arguments:")
-        debug_logs.append(f"  - groww_company_id: {groww_company_id}")
-        debug_logs.append(f"  - page: {page}")
-        debug_logs.append(f"  - size: {size}")
-        debug_logs.append(f"  - debug: {debug}")
-
-    url = f"{news_url}/{groww_company_id}"
-    params = {
-        "page": page,
-        "size": size
-    }
-
-    if debug:
-        debug_logs.append(f"[DEBUG] API URL: {url}")
-        debug_logs.append(f"[DEBUG] Request Parameters: {params}")
-        debug_logs.append(f"[DEBUG] Full URL with params: {url}?{'&'.join([f'{k}={v}' for k, v in params.items()])}")
-
-    try:
-        response = requests.get(url, params=params)
-        
-        if debug:
-            debug_logs.append(f"[DEBUG] Response Status Code: {response.status_code}")
-            debug_logs.append(f"[DEBUG] Response URL: {response.url}")
-            debug_logs.append(f"[DEBUG] Response Headers: {dict(response.headers)}")
-            debug_logs.append(f"[DEBUG] Response Time: {response.elapsed.total_seconds():.3f} seconds")
-            debug_logs.append(f"[DEBUG] Response Text (first 500 chars): {response.text[:500]}")
-        
-        response.raise_for_status()
-        json_data = response.json()
-        
-        if debug:
-            debug_logs.append(f"[DEBUG] Response JSON Keys: {list(json_data.keys())}")
-            if 'content' in json_data and isinstance(json_data['content'], list):
-                debug_logs.append(f"[DEBUG] Number of news items: {len(json_data['content'])}")
-            debug_logs.append(f"[DEBUG] API call successful")
-        
-        # The API already returns data in {"results": [...]} format
-        # Just wrap it in our consistent structure
-        return {
-            "data": json_data,  # API response already has "results" key
-            "debug_info": debug_logs if debug else None,
-            "error": None
-        }
-        
-    except requests.exceptions.RequestException as e:
-        error_msg = f"API request failed: {str(e)}"
-        if debug:
-            debug_logs.append(f"[DEBUG] Request Exception: {error_msg}")
-        
-        return {
-            "data": None,
-            "debug_info": debug_logs if debug else None,
-            "error": [error_msg]
-        }
+        return call()
+    return _cached_call(("news", groww_company_id, page, size), _news_cache, _news_disk_cache, call)
 
 
 def api_events(groww_company_id: str, debug: bool = False) -> dict:
@@ -320,83 +686,120 @@ def api_events(groww_company_id: str, debug: bool = False) -> dict:
             "error": [...] or None
         }
 
+    Successful non-debug responses are cached in-process and on disk for
+    EVENTS_CACHE_TTL seconds; each call returns its own copy of the envelope.
+
     Raises:
         Never raises exceptions - errors are returned in the response structure
     """
-    debug_logs = []
-    
+    call = partial(
+        _call_json,
+        events_url,
+        {"gsin": groww_company_id},
+        debug=debug,
+        ctx="api_events",
+        inputs={"groww_company_id": groww_company_id, "debug": debug},
+        error_prefix="HTTP Request failed",
+        describe=_describe_events
+    )
     if debug:
-        debug_logs.append(f"[DEBUG] Function: api_events")
-        debug_logs.append(f"[DEBUG] Input Arguments:")
-        debug_logs.append(f"  - groww_company_id: {groww_company_id}")
-        debug_logs.append(f"  - debug: {debug}")
+        return call()
+    return _cached_call(("events", groww_company_id), _events_cache, _events_disk_cache, call)
 
-    url = f"{events_url}?gsin={groww_company_id}"
 
-    if debug:
-        debug_logs.append(f"[DEBUG] API URL: {events_url}")
-        debug_logs.append(f"[DEBUG] Request Parameters: gsin={groww_company_id}")
-        debug_logs.append(f"[DEBUG] Full URL: {url}")
+def _fan_out(func, arg_tuples: Iterable[Tuple], max_workers: int, **kwargs) -> List[Dict]:
+    """Run `func(*args, **kwargs)` for every args tuple on a thread pool, preserving input order."""
+    arg_tuples = list(arg_tuples)
+    if not arg_tuples:
+        return []
 
-    try:
-        response = requests.get(url)
-        
-        if debug:
-            debug_logs.append(f"[DEBUG] Response Status Code: {response.status_code}")
-            debug_logs.append(f"[DEBUG] Response URL: {response.url}")
-            debug_logs.append(f"[DEBUG] Response Headers: {dict(response.headers)}")
-            debug_logs.append(f"[DEBUG] Response Time: {response.elapsed.total_seconds():.3f} seconds")
-            debug_logs.append(f"[DEBUG] Response Text (first 500 chars): {response.text[:500]}")
-        
-        response.raise_for_status()
-        json_data = response.json()
-        
-        if debug:
-            debug_logs.append(f"[DEBUG] JSON parsed successfully")
-            debug_logs.append(f"[DEBUG] Response JSON Keys: {list(json_data.keys())}")
-            if 'events' in json_data and isinstance(json_data['events'], list):
-                debug_logs.append(f"[DEBUG] Number of events: {len(json_data['events'])}")
-            debug_logs.append(f"[DEBUG] API call successful")
-        
-        # API returns the full response, keep it as is
-        return {
-            "data": json_data,
-            "debug_info": debug_logs if debug else None,
-            "error": None
-        }
-        
-    except requests.exceptions.RequestException as req_err:
-        error_msg = f"HTTP Request failed: {str(req_err)}"
-        if debug:
-            debug_logs.append(f"[DEBUG] HTTP Request failed: {str(req_err)}")
-            debug_logs.append(f"[DEBUG] Error type: {type(req_err).__name__}")
-        
-        return {
-            "data": None,
-            "debug_info": debug_logs if debug else None,
-            "error": [error_msg]
-        }
-    
-    except ValueError as val_err:
-        error_msg = f"Failed to decode JSON: {str(val_err)}"
-        if debug:
-            debug_logs.append(f"[DEBUG] JSON decode failed: {str(val_err)}")
-            debug_logs.append(f"[DEBUG] Error type: {type(val_err).__name__}")
-        
-        return {
-            "data": None,
-            "debug_info": debug_logs if debug else None,
-            "error": [error_msg]
-        }
-    
-    except Exception as e:
-        error_msg = f"Unexpected error: {str(e)}"
-        if debug:
-            debug_logs.append(f"[DEBUG] Unexpected error: {str(e)}")
-            debug_logs.append(f"[DEBUG] Error type: {type(e).__name__}")
-        
-        return {
-            "data": None,
-            "debug_info": debug_logs if debug else None,
-            "error": [error_msg]
-        }
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(arg_tuples))) as executor:
+        futures = [executor.submit(func, *args, **kwargs) for args in arg_tuples]
+        return [future.result() for future in futures]
+
+
+def call_price_api_many(
+    calls: Iterable[Tuple[str, int, int, int]],
+    debug: bool = False,
+    max_workers: int = 8,
+    use_cache: bool = True
+) -> List[Dict]:
+    """
+    Fetch several candle windows concurrently over the shared HTTP session.
+
+    Parameters:
+    - calls (iterable): (ticker, start, end, interval) tuples, as accepted by `call_price_api`
+    - debug (bool): If True, each result includes its debug logs
+    - max_workers (int): Maximum number of requests kept in flight at once
+    - use_cache (bool): Passed through to `call_price_api`
+
+    Returns:
+    - list: One `call_price_api` result dict per input tuple, in input order
+    """
+    return _fan_out(call_price_api, calls, max_workers, debug=debug, use_cache=use_cache)
+
+
+def call_price_api_iter(
+    calls: Iterable[Tuple[str, int, int, int]],
+    debug: bool = False,
+    max_workers: int = 8,
+    use_cache: bool = True
+) -> Iterator[Dict]:
+    """
+    Like `call_price_api_many`, but yields each result in input order as soon as it is ready.
+
+    At most `max_workers` requests are in flight and nothing is fetched ahead of that,
+    so only a bounded number of batches are held in memory however long `calls` is.
+    """
+    calls = iter(calls)
+    pending = deque()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for args in calls:
+            pending.append(executor.submit(call_price_api, *args, debug=debug, use_cache=use_cache))
+            if len(pending) >= max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def api_news_many(
+    groww_company_ids: Iterable[str],
+    page: int = 0,
+    size: int = 10,
+    debug: bool = False,
+    max_workers: int = 8
+) -> List[Dict]:
+    """
+    Fetch news for several Groww company IDs concurrently.
+
+    Returns:
+        list: One `api_news` result dict per company ID, in input order
+    """
+    return _fan_out(
+        api_news,
+        ((groww_company_id,) for groww_company_id in groww_company_ids),
+        max_workers,
+        page=page,
+        size=size,
+        debug=debug
+    )
+
+
+def api_events_many(
+    groww_company_ids: Iterable[str],
+    debug: bool = False,
+    max_workers: int = 8
+) -> List[Dict]:
+    """
+    Fetch corporate events for several Groww company IDs concurrently.
+
+    Returns:
+        list: One `api_events` result dict per company ID, in input order
+    """
+    return _fan_out(
+        api_events,
+        ((groww_company_id,) for groww_company_id in groww_company_ids),
+        max_workers,
+        debug=debug
+    )
@@ -0,0 +1,213 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Thread-safe in-memory cache with per-entry expiry and LRU eviction.
+
+    Args:
+        maxsize (int): Maximum number of entries kept; the least recently used entry
+                       is evicted when the cache is full
+        ttl (float): Default time-to-live of an entry in seconds
+
+    Example:
+        >>> cache = TTLCache(maxsize=2, ttl=60)
+        >>> cache.set("RELIANCE", {"search_id": "reliance-industries-ltd"})
+        >>> cache.get("RELIANCE")
+        {'search_id': 'reliance-industries-ltd'}
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for `key`, or `default` if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store `value` under `key` for `ttl` seconds (defaults to the cache TTL)."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove `key` and return its value, or `default` if missing or expired."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+        if entry is None or entry[1] <= time.monotonic():
+            return default
+        return entry[0]
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class FileCache:
+    """
+    Persistent JSON cache storing one file per entry under a directory.
+
+    Entries survive across processes, which makes it suitable for data that never
+    changes once published (e.g. candles of closed trading sessions). Writes are
+    atomic, unreadable or expired files are treated as misses, and the oldest files
+    are pruned once the directory grows past `max_bytes`. Disk errors never
+    propagate; the cache just behaves as empty.
+
+    Writes keep a running size total instead of scanning the directory each time; the
+    directory is only rescanned when that total passes `max_bytes` (pruning down to
+    PRUNE_TARGET of it) and every RESCAN_WRITES writes, to pick up other processes' files.
+
+    Args:
+        root (str): Directory holding the cache files, created on first write
+        max_bytes (int): Approximate upper bound for the total size of the cache files
+        ttl (float, optional): Default time-to-live in seconds; None keeps entries forever
+
+    Example:
+        >>> cache = FileCache("/tmp/growfin-cache")
+        >>> cache.set(("RELIANCE", 1704079800000, 1704180600000, 1440), {"candles": []})
+        >>> cache.get(("RELIANCE", 1704079800000, 1704180600000, 1440))
+        {'candles': []}
+    """
+
+    # Fraction of max_bytes left after a prune, so the next one is many writes away
+    PRUNE_TARGET = 0.9
+    RESCAN_WRITES = 1024
+
+    def __init__(self, root: str, max_bytes: int = 200 * 1024 * 1024, ttl: Optional[float] = None):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # Estimated size of the cache files; None until the directory is first scanned
+        self._total_bytes = None
+        self._writes = 0
+
+    def _path(self, key: Hashable) -> str:
+        digest = hashlib.md5(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.root, digest + ".json")
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for `key`, or `default` if missing, expired or unreadable."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                entry = json.loads(f.read())
+        except FileNotFoundError:
+            return default
+        except (OSError, ValueError):
+            self._discard(path)
+            return default
+
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and expires_at <= time.time():
+            self._discard(path)
+            return default
+        return entry.get("value", default)
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store the JSON-serialisable `value` under `key` for `ttl` seconds (defaults to the cache TTL)."""
+        ttl = self.ttl if ttl is None else ttl
+        entry = {
+            "expires_at": None if ttl is None else time.time() + ttl,
+            "value": value
+        }
+        path = self._path(key)
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f, separators=(",", ":"))
+                    size = f.tell()
+                try:
+                    replaced = os.stat(path).st_size
+                except OSError:
+                    replaced = 0
+                os.replace(tmp_path, path)
+            except BaseException:
+                self._discard(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            return
+
+        with self._lock:
+            self._writes += 1
+            if self._total_bytes is not None and self._writes % self.RESCAN_WRITES:
+                self._total_bytes += size - replaced
+                if self._total_bytes <= self.max_bytes:
+                    return
+            self._prune()
+
+    def clear(self) -> None:
+        """Delete every cache file."""
+        for entry in self._entries():
+            self._discard(entry.path)
+        with self._lock:
+            self._total_bytes = 0
+
+    def _entries(self):
+        try:
+            return [entry for entry in os.scandir(self.root) if entry.name.endswith(".json")]
+        except OSError:
+            return []
+
+    def _prune(self) -> None:
+        """
+        Rescan the directory and, if it is over `max_bytes`, delete the least recently
+        written files down to PRUNE_TARGET of it. Called with the lock held.
+        """
+        files = []
+        total = 0
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+
+        if total > self.max_bytes:
+            target = self.max_bytes * self.PRUNE_TARGET
+            files.sort()
+            for _, size, path in files:
+                if total <= target:
+                    break
+                self._discard(path)
+                total -= size
+        self._total_bytes = total
+
+    @staticmethod
+    def _discard(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -1,3 +1,6 @@
+import os
+from types import MappingProxyType
+
 hist_url="https://groww.in/v1/api/charting_service/v2/chart/exchange/NSE/segment/CASH"
 live_url="https://groww.in/v1/api/charting_service/v2/chart/exchange/NSE/segment/CASH"
 news_url="https://groww.in/v1/api/groww-news/v2/stocks/news"
@@ -13,11 +16,27 @@ HTTP_HEADERS = {
     'Connection': 'keep-alive',
 }
 
-# Supported candle intervals in minutes
-SUPPORTED_INTERVALS = [1, 5, 10, 15, 30, 60, 240, 1440]
-SUPPORTED_LIVE_INTERVALS = [1, 5, 10, 15, 30, 60, 240]
+# (connect, read) timeout in seconds applied to every HTTP request
+DEFAULT_TIMEOUT = (3.05, 10)
+
+# Retries for transient failures: 3 attempts with exponential backoff (0.3s, 0.6s, 1.2s)
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_FORCELIST = (429, 500, 502, 503, 504)
+
+# Statuses meaning the endpoint rejected the ID itself (renamed or delisted symbol),
+# as opposed to a transient failure; only these drop a learned symbol resolution
+INVALID_ID_STATUSES = (400, 404)
+
+# Supported candle intervals in minutes (frozenset for O(1) membership checks,
+# ordered tuple for display)
+SUPPORTED_INTERVALS_ORDERED = (1, 5, 10, 15, 30, 60, 240, 1440)
+SUPPORTED_INTERVALS = frozenset(SUPPORTED_INTERVALS_ORDERED)
+SUPPORTED_LIVE_INTERVALS_ORDERED = (1, 5, 10, 15, 30, 60, 240)
+SUPPORTED_LIVE_INTERVALS = frozenset(SUPPORTED_LIVE_INTERVALS_ORDERED)
+
 # API lookback limitations in days from the current date, based on interval
-API_LOOKBACK_LIMITS = {
+API_LOOKBACK_LIMITS = MappingProxyType({
     1: 80,      # 1min: 80 days max
     5: 80,      # 5min: 80 days max
     10: 80,     # 10min: 80 days max
@@ -26,16 +45,46 @@ API_LOOKBACK_LIMITS = {
     60: 80,     # 60min: 80 days max
     240: 80,    # 4hour: 80 days max
     1440: 3650   # Daily: ~1 year max
-}
+})
 
 # Batching limits per API request to avoid overwhelming the API
-BATCH_LIMITS = {
-    1: {'max_days_per_request': 7},
-    5: {'max_days_per_request': 15},
-    10: {'max_days_per_request': 30},
-    15: {'max_days_per_request': 30},
-    30: {'max_days_per_request': 30},
-    60: {'max_days_per_request': 30},
-    240: {'max_days_per_request': 60},
-    1440: {'max_days_per_request': 1000}
-}
+BATCH_LIMITS = MappingProxyType({
+    1: MappingProxyType({'max_days_per_request': 7}),
+    5: MappingProxyType({'max_days_per_request': 15}),
+    10: MappingProxyType({'max_days_per_request': 30}),
+    15: MappingProxyType({'max_days_per_request': 30}),
+    30: MappingProxyType({'max_days_per_request': 30}),
+    60: MappingProxyType({'max_days_per_request': 30}),
+    240: MappingProxyType({'max_days_per_request': 60}),
+    1440: MappingProxyType({'max_days_per_request': 1000})
+})
+
+# In-process response cache lifetimes in seconds
+SEARCH_CACHE_TTL = 300                  # call_nse_api search results
+INFO_CACHE_TTL = 300                    # api_info company headers
+CLOSED_CANDLES_CACHE_TTL = 6 * 3600     # call_price_api windows that ended in the past
+OPEN_CANDLES_CACHE_TTL = 60             # call_price_api windows still receiving candles
+SYMBOL_RESOLUTION_CACHE_TTL = 24 * 3600 # get_search_id / get_growid (and Ticker) symbol mappings
+SYMBOL_RESOLUTION_REFRESH_AFTER = 3600  # older lookups are served while refreshed in the background
+NEWS_CACHE_TTL = 300                    # api_news pages (also kept on disk)
+EVENTS_CACHE_TTL = 3600                 # api_events corporate actions (also kept on disk)
+
+# On-disk cache for candle windows that ended before today's market open;
+# set GROWFIN_CACHE_DIR to an empty string to disable it
+DISK_CACHE_DIR = os.environ.get("GROWFIN_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".growfin"))
+DISK_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+# Optional static symbol,search_id,groww_id master list (.csv or .csv.gz) consulted
+# before the search API; symbols resolved online are also kept in DISK_CACHE_DIR/symbols.csv
+# for SYMBOL_RESOLUTION_CACHE_TTL
+SYMBOL_TABLE_PATH = os.environ.get("GROWFIN_SYMBOLS_CSV") or None
+
+# Closest NSE codes offered by get_search_id when a ticker has no exact match
+SUGGESTION_LIMIT = 5
+
+# NSE session timing (IST has no daylight saving, so a fixed offset is exact)
+IST_UTC_OFFSET_SECONDS = 5 * 3600 + 30 * 60
+MARKET_OPEN_IST_SECONDS = 9 * 3600 + 15 * 60    # 09:15 IST, seconds after midnight
+
+# Optional JSON list of extra 'YYYY-MM-DD' NSE holidays (e.g. years not built into market_calendar)
+HOLIDAYS_FILE_PATH = os.environ.get("GROWFIN_HOLIDAYS_JSON") or None
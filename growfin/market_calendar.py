@@ -0,0 +1,86 @@
+import json
+import logging
+import os
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, FrozenSet, Optional
+from .constants import IST_UTC_OFFSET_SECONDS, HOLIDAYS_FILE_PATH
+
+IST = timezone(timedelta(seconds=IST_UTC_OFFSET_SECONDS))
+
+# Indexed by date.weekday(); avoids the locale-aware calendar.day_name lookup
+WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_IS_WEEKEND = (False, False, False, False, False, True, True)
+
+logger = logging.getLogger(__name__)
+
+# NSE equity segment trading holidays falling on weekdays, per the exchange circulars.
+# One list per year; publishing a new year's calendar is a data change only.
+_HOLIDAYS_DATA_PATH = os.path.join(os.path.dirname(__file__), "data", "nse_holidays.json")
+
+
+def _load_builtin_holidays(path: str) -> Dict[int, FrozenSet[date]]:
+    """Read the shipped {"YYYY": ["YYYY-MM-DD", ...]} calendar; a missing or invalid file yields no years."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return {
+                int(year): frozenset(date.fromisoformat(day) for day in days)
+                for year, days in json.load(f).items()
+            }
+    except (OSError, ValueError, TypeError, AttributeError):
+        return {}
+
+
+def _load_extra_holidays(path: Optional[str]) -> FrozenSet[date]:
+    """Read a JSON list of 'YYYY-MM-DD' holiday dates; a missing or invalid file adds nothing."""
+    if not path:
+        return frozenset()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return frozenset(date.fromisoformat(day) for day in json.load(f))
+    except (OSError, ValueError, TypeError):
+        return frozenset()
+
+
+_NSE_HOLIDAYS_BY_YEAR = _load_builtin_holidays(_HOLIDAYS_DATA_PATH)
+_EXTRA_HOLIDAYS = _load_extra_holidays(HOLIDAYS_FILE_PATH)
+
+# Built once at import; years not shipped here can be supplied via GROWFIN_HOLIDAYS_JSON
+NSE_HOLIDAYS = frozenset().union(*_NSE_HOLIDAYS_BY_YEAR.values()) | _EXTRA_HOLIDAYS
+
+# Last calendar year with any listed holiday; later days can only be judged by weekday
+LAST_COVERED_YEAR = max(
+    list(_NSE_HOLIDAYS_BY_YEAR) + [day.year for day in _EXTRA_HOLIDAYS],
+    default=None
+)
+
+_warned_years = set()
+
+
+def _check_coverage(day: date) -> None:
+    """Warn once per year when `day` is past the newest holiday calendar, so the gap is noticed."""
+    if LAST_COVERED_YEAR is not None and day.year <= LAST_COVERED_YEAR:
+        return
+    if day.year not in _warned_years:
+        _warned_years.add(day.year)
+        logger.warning(
+            "No NSE holiday calendar for %d (newest is %s); only weekends are treated as closed. "
+            "Add the year to growfin/data/nse_holidays.json or list its dates in GROWFIN_HOLIDAYS_JSON.",
+            day.year, LAST_COVERED_YEAR
+        )
+
+
+def today_ist() -> date:
+    """Current calendar date on the exchange clock, regardless of the local timezone."""
+    return datetime.now(IST).date()
+
+
+def is_holiday(day: date) -> bool:
+    """True if `day` is a listed NSE trading holiday."""
+    _check_coverage(day)
+    return day in NSE_HOLIDAYS
+
+
+def is_trading_day(day: date) -> bool:
+    """True if NSE trades on `day`: a weekday that is not a listed holiday."""
+    _check_coverage(day)
+    return not _IS_WEEKEND[day.weekday()] and day not in NSE_HOLIDAYS
@@ -0,0 +1,231 @@
+import csv
+import gzip
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from .constants import DISK_CACHE_DIR, SYMBOL_TABLE_PATH, SYMBOL_RESOLUTION_CACHE_TTL
+
+# Columns of the static master list
+_FIELDS = ("symbol", "search_id", "groww_id")
+# Columns of the local table of symbols learned online; rows without fetched_at
+# (written before it existed) are treated as expired
+_LEARNED_FIELDS = _FIELDS + ("fetched_at",)
+
+_USER_TABLE_PATH = os.path.join(DISK_CACHE_DIR, "symbols.csv") if DISK_CACHE_DIR else None
+# The local table is append-only; it is rewritten with only its live rows once at least
+# this many rows (and more than half of them) are superseded, expired or tombstones
+_COMPACT_MIN_DEAD_ROWS = 256
+
+# symbol -> (search_id, groww_id, fetched_at); fetched_at is None for master list rows,
+# which never expire
+_table: Optional[Dict[str, Tuple[str, Optional[str], Optional[float]]]] = None
+_table_lock = threading.Lock()
+# Data rows currently in the local table file, live or dead
+_learned_rows = 0
+
+
+def _is_fresh(fetched_at: Optional[float], now: float) -> bool:
+    return fetched_at is None or now - fetched_at < SYMBOL_RESOLUTION_CACHE_TTL
+
+
+def _read_table(path: str, table: Dict[str, Tuple[str, Optional[str], Optional[float]]]) -> None:
+    """Merge the rows of a symbol,search_id,groww_id master CSV (optionally gzipped) into `table`."""
+    opener = gzip.open if path.endswith(".gz") else open
+    try:
+        with opener(path, "rt", encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                symbol = (row.get("symbol") or "").strip().upper()
+                search_id = (row.get("search_id") or "").strip()
+                if symbol and search_id:
+                    table[symbol] = (search_id, (row.get("groww_id") or "").strip() or None, None)
+    except (OSError, csv.Error, UnicodeDecodeError):
+        pass
+
+
+def _read_learned(path: str, table: Dict[str, Tuple[str, Optional[str], Optional[float]]], now: float) -> int:
+    """
+    Replay the local table's rows in write order; later rows win.
+
+    Rows older than SYMBOL_RESOLUTION_CACHE_TTL are skipped, so learned symbols are
+    re-resolved online at least once a day. A row with an empty search_id is a
+    tombstone written by `forget_symbol` and drops the symbol. Returns the number of
+    data rows in the file.
+    """
+    rows = 0
+    try:
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            next(reader, None)  # header
+            for row in reader:
+                rows += 1
+                if len(row) < len(_LEARNED_FIELDS):
+                    continue
+                symbol, search_id, groww_id, fetched_at = (value.strip() for value in row[:4])
+                symbol = symbol.upper()
+                if not symbol:
+                    continue
+                if not search_id:
+                    table.pop(symbol, None)
+                    continue
+                try:
+                    fetched_at = float(fetched_at)
+                except ValueError:
+                    continue
+                if _is_fresh(fetched_at, now):
+                    table[symbol] = (search_id, groww_id or None, fetched_at)
+    except (OSError, csv.Error, UnicodeDecodeError):
+        pass
+    return rows
+
+
+def _get_table() -> Dict[str, Tuple[str, Optional[str], Optional[float]]]:
+    """Load the symbol table on first use: locally learned rows, then the static master list over them."""
+    global _table, _learned_rows
+
+    if _table is not None:
+        return _table
+
+    with _table_lock:
+        if _table is None:
+            table = {}
+            if _USER_TABLE_PATH:
+                _learned_rows = _read_learned(_USER_TABLE_PATH, table, time.time())
+            # Curated data wins over anything learned online
+            if SYMBOL_TABLE_PATH:
+                _read_table(SYMBOL_TABLE_PATH, table)
+            _table = table
+            _maybe_compact()
+
+    return _table
+
+
+def _append_learned(row: Tuple[str, str, str, str]) -> None:
+    """
+    Append one row to the local table under DISK_CACHE_DIR; disk errors are ignored.
+
+    Called with _table_lock held.
+    """
+    global _learned_rows
+
+    if not _USER_TABLE_PATH:
+        return
+    try:
+        os.makedirs(os.path.dirname(_USER_TABLE_PATH), exist_ok=True)
+        new_file = not os.path.exists(_USER_TABLE_PATH)
+        with open(_USER_TABLE_PATH, "a", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(_LEARNED_FIELDS)
+                _learned_rows = 0
+            writer.writerow(row)
+        _learned_rows += 1
+    except OSError:
+        return
+    if _learned_rows % _COMPACT_MIN_DEAD_ROWS == 0:
+        _maybe_compact()
+
+
+def _maybe_compact() -> None:
+    """
+    Rewrite the local table with only its live rows when most of it is dead.
+
+    The new file is written next to the old one and swapped in with os.replace, so a
+    concurrent reader sees either version whole. Learned rows shadowed by the master
+    list are not kept. Called with _table_lock held; disk errors are ignored.
+    """
+    global _learned_rows
+
+    if not _USER_TABLE_PATH or _learned_rows < _COMPACT_MIN_DEAD_ROWS:
+        return
+    now = time.time()
+    live = [
+        (symbol, search_id, groww_id or "", repr(fetched_at))
+        for symbol, (search_id, groww_id, fetched_at) in _table.items()
+        if fetched_at is not None and _is_fresh(fetched_at, now)
+    ]
+    dead = _learned_rows - len(live)
+    if dead < _COMPACT_MIN_DEAD_ROWS or dead <= len(live):
+        return
+
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(_USER_TABLE_PATH), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(_LEARNED_FIELDS)
+                writer.writerows(live)
+            os.replace(tmp_path, _USER_TABLE_PATH)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+    except OSError:
+        return
+    _learned_rows = len(live)
+
+
+def lookup_symbol(symbol: str) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Return (search_id, groww_id) for a known NSE symbol without any network call.
+
+    groww_id is None when only the search_id is known. Returns None for unknown
+    symbols and for learned rows older than SYMBOL_RESOLUTION_CACHE_TTL.
+    """
+    entry = _get_table().get(symbol.upper())
+    if entry is None or not _is_fresh(entry[2], time.time()):
+        return None
+    return entry[0], entry[1]
+
+
+def remember_symbol(symbol: str, search_id: str, groww_id: Optional[str] = None) -> None:
+    """
+    Record a symbol resolved over the network so later lookups (and later runs) skip it.
+
+    Rows are appended, with the time they were fetched, to the local table under
+    DISK_CACHE_DIR; later rows win on load.
+    """
+    symbol = symbol.upper()
+    table = _get_table()
+    now = time.time()
+
+    with _table_lock:
+        known = table.get(symbol)
+        if groww_id is None and known is not None and known[0] == search_id:
+            groww_id = known[1]
+        if known is not None and known[:2] == (search_id, groww_id) and _is_fresh(known[2], now):
+            return
+        table[symbol] = (search_id, groww_id, now)
+        _append_learned((symbol, search_id, groww_id or "", repr(now)))
+
+
+def forget_symbol(symbol: str) -> None:
+    """
+    Drop a symbol whose search_id or groww_id stopped working (e.g. renamed or delisted).
+
+    The next lookup resolves it online again. A master list row is only dropped for
+    the current process; learned rows are also dropped for later runs.
+    """
+    symbol = symbol.upper()
+    table = _get_table()
+
+    with _table_lock:
+        if table.pop(symbol, None) is not None:
+            _append_learned((symbol, "", "", repr(time.time())))
+
+
+def clear_symbol_table(delete_file: bool = False) -> None:
+    """Forget the loaded table; with `delete_file`, also remove the locally learned rows."""
+    global _table, _learned_rows
+
+    with _table_lock:
+        _table = None
+        if delete_file and _USER_TABLE_PATH:
+            try:
+                os.remove(_USER_TABLE_PATH)
+            except OSError:
+                pass
+            _learned_rows = 0
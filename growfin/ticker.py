@@ -1,34 +1,180 @@
-import pandas as pd
-from typing import Optional, Union
-from datetime import datetime
-import calendar
+from __future__ import annotations
 
-from .utils import generate_parameters, generate_live_parameters
-from .api import call_price_api, api_info, api_news, api_events
-from .utils_info import get_search_id, get_growid
+import logging
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from itertools import chain
+
+from .utils import generate_parameters, generate_live_parameters, data_to_dataframe
+from .api import call_price_api_many, call_price_api_iter, api_info, api_news, api_events, _fan_out, _rejects_id
+from .utils_info import clear_lookup_cache, forget_lookup, get_search_id, get_growid
+from .symbols import forget_symbol, lookup_symbol, remember_symbol
+from .market_calendar import WEEKDAY_NAMES, is_holiday, today_ist
+
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Marks a lazily resolved attribute that has not been looked up yet
+_UNRESOLVED = object()
+
+
+def _merge_batch_results(results: List[Dict], debug: bool) -> dict:
+    """
+    Combine per-batch `call_price_api` results into a single history/live response.
+
+    All batches have completed by the time this runs, so the candle list is sized
+    exactly once and filled by slice assignment instead of growing batch by batch.
+    """
+    batch_candles = [
+        result["data"]["candles"]
+        for result in results
+        if result.get("data") and "candles" in result["data"]
+    ]
+
+    all_candles = [None] * sum(len(candles) for candles in batch_candles)
+    pos = 0
+    for candles in batch_candles:
+        all_candles[pos:pos + len(candles)] = candles
+        pos += len(candles)
+
+    errors = list(chain.from_iterable(result["error"] for result in results if result.get("error")))
+    debug_logs = None
+    if debug:
+        debug_logs = list(chain.from_iterable(result["debug_info"] for result in results if result.get("debug_info")))
+
+    return {
+        "data": {"candles": all_candles} if all_candles else None,
+        "debug_info": debug_logs,
+        "error": errors if errors else None
+    }
 
 
 class Ticker:
+    # Fixed attribute layout: no per-instance __dict__ when scanning large universes
+    __slots__ = ("symbol", "debug", "suggestions", "search_id", "_groww_id")
+
     def __init__(self, symbol: str, debug: bool = False):
         self.symbol = symbol.upper()
         self.debug = debug
         self.suggestions = None
         self.search_id = None
-        self.groww_id = None
+        # Resolved lazily: price-only workflows never need the Groww company ID
+        self._groww_id = _UNRESOLVED
+
+        # Known symbols resolve from the local symbol table without a search call;
+        # debug runs always resolve over the network so their logs stay real
+        if not debug:
+            known = lookup_symbol(self.symbol)
+            if known is not None:
+                self.search_id, groww_id = known
+                if groww_id:
+                    self._groww_id = groww_id
+                return
 
+        # get_search_id keeps the shared, per-ticker resolution cache
         try:
             result = get_search_id(self.symbol, debug=debug)
             if isinstance(result, dict) and "suggestions" in result:
                 self.suggestions = result["suggestions"]
                 if debug:
-                    print(f"[DEBUG] Suggestions found for '{self.symbol}': {self.suggestions}")
+                    logger.debug("Suggestions found for '%s': %s", self.symbol, self.suggestions)
+            elif isinstance(result, str):
+                logger.error("Error initializing Ticker('%s'): %s", self.symbol, result)
             else:
                 self.search_id = result.get("search_id")
-                self.groww_id = get_growid(self.symbol, debug=debug)
+                if self.search_id:
+                    remember_symbol(self.symbol, self.search_id)
                 if debug:
-                    print(f"[DEBUG] Found search_id: {self.search_id}, groww_id: {self.groww_id}")
-        except Exception as e:
-            print(f"❌ Error initializing Ticker('{self.symbol}'): {e}")
+                    logger.debug("Found search_id: %s", self.search_id)
+        except Exception:
+            logger.exception("Error initializing Ticker('%s')", self.symbol)
+            return
+
+        self._log_suggestions()
+
+    def _log_suggestions(self) -> None:
+        """Tell the user once, at construction, that the symbol needs correcting."""
+        if self.suggestions:
+            logger.info("Suggestions for '%s': %s", self.symbol, self.suggestions)
+
+    @property
+    def groww_id(self) -> Union[str, dict, None]:
+        """Groww company ID (e.g. 'GSTK500325'), looked up on first access."""
+        if self._groww_id is not _UNRESOLVED:
+            return self._groww_id
+
+        groww_id = None
+        if self.search_id:
+            groww_id = get_growid(self.symbol, debug=self.debug)
+            if self.debug:
+                logger.debug("Resolved groww_id: %s", groww_id)
+            if isinstance(groww_id, str):
+                remember_symbol(self.symbol, self.search_id, groww_id)
+
+        self._groww_id = groww_id
+        return groww_id
+
+    @groww_id.setter
+    def groww_id(self, value: Union[str, dict, None]) -> None:
+        self._groww_id = value
+
+    def _suggestion_response(self, debug_logs: Optional[List[str]] = None) -> Optional[dict]:
+        """
+        Error response shared by every data method when the symbol did not resolve
+        to an exact match, or None for a resolved symbol.
+        """
+        if not self.suggestions:
+            return None
+        return {
+            "data": None,
+            "debug_info": debug_logs,
+            "error": [f"Invalid symbol '{self.symbol}'"] + [str(s) for s in self.suggestions]
+        }
+
+    @classmethod
+    def bulk(
+        cls,
+        symbols: Iterable[str],
+        debug: bool = False,
+        resolve_groww_id: bool = True,
+        max_workers: int = 8
+    ) -> List[Ticker]:
+        """
+        Construct Tickers for many symbols, resolving them concurrently.
+
+        Symbol lookups (and, with `resolve_groww_id`, the Groww company IDs needed by
+        news/events) run on a thread pool over the shared HTTP session and populate the
+        shared resolution caches, so later `Ticker(symbol)` calls are free.
+
+        Returns:
+            list: One Ticker per input symbol, in input order
+        """
+        return _fan_out(
+            cls._resolve,
+            ((symbol,) for symbol in symbols),
+            max_workers,
+            debug=debug,
+            resolve_groww_id=resolve_groww_id
+        )
+
+    @classmethod
+    def _resolve(cls, symbol: str, debug: bool, resolve_groww_id: bool) -> Ticker:
+        ticker = cls(symbol, debug=debug)
+        if resolve_groww_id:
+            ticker.groww_id
+        return ticker
+
+    def _forget_resolution(self) -> None:
+        """Drop this symbol's cached resolution after its IDs fail, so the next Ticker re-resolves it."""
+        forget_symbol(self.symbol)
+        forget_lookup(self.symbol, self.search_id)
+
+    @classmethod
+    def clear_resolution_cache(cls) -> None:
+        """Forget every cached symbol resolution (same as `clear_lookup_cache()`)."""
+        clear_lookup_cache()
 
     def history(
         self,
@@ -36,13 +182,15 @@ class Ticker:
         lookback: Optional[int] = None,
         start: Optional[str] = None,
         end: Optional[str] = None,
-        debug: bool = False
+        debug: bool = False,
+        use_cache: bool = True
 ) ->     dict:
         """
         Fetches historical OHLCV data for the stock using Groww's candle API.
 
         This method supports both lookback mode (e.g., last N days) and fixed date range mode.
-        It automatically handles batching for large date ranges as per Groww's interval limits.
+        It automatically handles batching for large date ranges as per Groww's interval limits;
+        the batches are fetched concurrently over the shared HTTP session.
 
         Parameters:
         - interval (int): Candle interval in minutes (e.g., 1, 15, 60)
@@ -50,6 +198,7 @@ class Ticker:
         - start (str, optional): Start datetime string in format 'YYYY-MM-DD HH:MM'
         - end (str, optional): End datetime string in format 'YYYY-MM-DD HH:MM'
         - debug (bool, optional): If True, includes debug logs per batch
+        - use_cache (bool, optional): If False, bypass the in-process and on-disk candle caches
 
         Returns:
         - dict: {
@@ -61,16 +210,62 @@ class Ticker:
         }
         """
 
-        # If the symbol wasn't matched, suggest alternatives
-        if self.suggestions:
-            print(f"Suggestions for '{self.symbol}':")
-            for s in self.suggestions:
-                print(s)
-            return {
-                "data": None,
-                "debug_info": None,
-                "error": [f"Invalid symbol '{self.symbol}'"]
-            }
+        calls, response = self._history_calls(interval, lookback, start, end, debug)
+        if response is not None:
+            return response
+
+        # Batches are fetched concurrently; results come back in batch order
+        results = call_price_api_many(calls, debug=debug, use_cache=use_cache)
+        return self._checked(_merge_batch_results(results, debug))
+
+    def history_iter(
+        self,
+        interval: int,
+        lookback: Optional[int] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        debug: bool = False,
+        use_cache: bool = True
+    ) -> Iterator[dict]:
+        """
+        Yields historical candles one batch at a time instead of merging them into one list.
+
+        Takes the same arguments as `history()`. Each item is that batch's
+        `call_price_api` response (`data`, `debug_info`, `error`), in chronological
+        order; batches are still fetched concurrently, but only a few are held in
+        memory at once, which suits long 1-minute lookbacks that are aggregated on the fly.
+        If the symbol is invalid or the parameters are rejected, a single error
+        response is yielded.
+        """
+        calls, response = self._history_calls(interval, lookback, start, end, debug)
+        if response is not None:
+            yield response
+            return
+
+        for result in call_price_api_iter(calls, debug=debug, use_cache=use_cache):
+            yield result
+
+    def _checked(self, response: dict) -> dict:
+        """
+        Forget the symbol's resolution when every candle batch failed and the endpoint
+        rejected the ID, e.g. after a rename or delisting; transient failures keep it.
+        """
+        if response["data"] is None and _rejects_id(response["error"]):
+            self._forget_resolution()
+        return response
+
+    def _history_calls(
+        self,
+        interval: int,
+        lookback: Optional[int],
+        start: Optional[str],
+        end: Optional[str],
+        debug: bool
+    ) -> Tuple[Optional[List[tuple]], Optional[dict]]:
+        """Plan the candle batches for a history request: (call tuples, None) or (None, error response)."""
+        response = self._suggestion_response()
+        if response is not None:
+            return None, response
 
         try:
             param_batches = generate_parameters(
@@ -81,39 +276,34 @@ class Ticker:
                 debug=debug
             )
         except Exception as e:
-            return {
+            return None, {
                 "data": None,
                 "debug_info": None,
                 "error": [str(e)]
             }
 
-        all_candles = []
-        debug_logs = []
-        errors = []
-
-        for batch in param_batches:
-            result = call_price_api(
-                ticker=self.symbol,
-                start=batch["start_time"],
-                end=batch["end_time"],
-                interval=batch["interval"],
-                debug=debug
-            )
-
-            if result.get("error"):
-                errors.extend(result["error"])
+        calls = [(self.symbol, batch["start_time"], batch["end_time"], batch["interval"]) for batch in param_batches]
+        return calls, None
 
-            if result.get("debug_info"):
-                debug_logs.extend(result["debug_info"])
-
-            if result.get("data") and "candles" in result["data"]:
-                all_candles.extend(result["data"]["candles"])
+    def history_df(
+        self,
+        interval: int,
+        lookback: Optional[int] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        use_cache: bool = True
+    ) -> pd.DataFrame:
+        """
+        Same as `history`, but returns the candles as a DataFrame with typed columns
+        (unix_timestamp, time_ist, open, high, low, close, volume).
 
-        return {
-            "data": {"candles": all_candles} if all_candles else None,
-            "debug_info": debug_logs if debug else None,
-            "error": errors if errors else None
-        }
+        Errors reported by individual batches are kept in `df.attrs["error"]`
+        (None when every batch succeeded); an empty frame is returned if nothing was fetched.
+        """
+        result = self.history(interval, lookback=lookback, start=start, end=end, use_cache=use_cache)
+        df = data_to_dataframe(result["data"] or {"candles": []})
+        df.attrs["error"] = result["error"]
+        return df
 
     def live(
         self,
@@ -126,11 +316,11 @@ class Ticker:
     
         This method calculates today's trading window for the given interval and
         fetches candles for live market hours. It optionally checks if today is a valid
-        trading day (Mon–Fri) unless overridden.
+        trading day (a weekday that is not an NSE holiday) unless overridden.
     
         Parameters:
         - interval (int): Candle interval in minutes (e.g., 1, 15, 60)
-        - check_trading_day (bool): If True, raises an error on weekends
+        - check_trading_day (bool): If True, returns an error on weekends and NSE holidays (IST)
         - debug (bool): If True, returns debug logs for each API call
     
         Returns:
@@ -143,26 +333,25 @@ class Ticker:
         }
         """
     
-        # Check for invalid symbols
-        if self.suggestions:
-            print(f"Suggestions for '{self.symbol}':")
-            for s in self.suggestions:
-                print(s)
-            return {
-                "data": None,
-                "debug_info": None,
-                "error": [f"Invalid symbol '{self.symbol}'"]
-            }
-    
-        today = datetime.now()
-        weekday = today.weekday()
+        response = self._suggestion_response()
+        if response is not None:
+            return response
     
-        if check_trading_day and weekday >= 5:
-            return {
-                "data": None,
-                "debug_info": None,
-                "error": [f"Today is {calendar.day_name[weekday]} — market is closed."]
-            }
+        if check_trading_day:
+            # Judge the day on the exchange clock, not the machine's local timezone
+            today = today_ist()
+            closed_reason = None
+            if today.weekday() >= 5:
+                closed_reason = f"Today is {WEEKDAY_NAMES[today.weekday()]} — market is closed."
+            elif is_holiday(today):
+                closed_reason = f"Today ({today.isoformat()}) is an NSE trading holiday — market is closed."
+
+            if closed_reason:
+                return {
+                    "data": None,
+                    "debug_info": None,
+                    "error": [closed_reason]
+                }
     
         try:
             param_batch = generate_live_parameters(interval, debug=debug)
@@ -173,50 +362,41 @@ class Ticker:
                 "error": [f"Failed to generate live parameters: {str(e)}"]
             }
     
-        all_candles = []
-        debug_logs = []
-        errors = []
-    
-        for batch in param_batch:
-            result = call_price_api(
-                ticker=self.symbol,
-                start=batch["start_time"],
-                end=batch["end_time"],
-                interval=batch["interval"],
-                debug=debug
-            )
-    
-            if result.get("error"):
-                errors.extend(result["error"])
-    
-            if result.get("debug_info"):
-                debug_logs.extend(result["debug_info"])
-    
-            if result.get("data") and "candles" in result["data"]:
-                all_candles.extend(result["data"]["candles"])
-    
-        return {
-            "data": {"candles": all_candles} if all_candles else None,
-            "debug_info": debug_logs if debug else None,
-            "error": errors if errors else None
-        }
+        # Live candles must be fresh, so skip the short-lived open-window cache
+        results = call_price_api_many(
+            [(self.symbol, batch["start_time"], batch["end_time"], batch["interval"]) for batch in param_batch],
+            debug=debug,
+            use_cache=False
+        )
+        return self._checked(_merge_batch_results(results, debug))
+
+    def live_df(self, interval: int, check_trading_day: bool = True) -> pd.DataFrame:
+        """
+        Same as `live`, but returns the candles as a DataFrame with typed columns;
+        errors are kept in `df.attrs["error"]`.
+        """
+        result = self.live(interval, check_trading_day=check_trading_day)
+        df = data_to_dataframe(result["data"] or {"candles": []})
+        df.attrs["error"] = result["error"]
+        return df
 
     def info(self, debug: bool = False):
-        if self.suggestions:
-            print(f"Suggestions for '{self.symbol}':")
-            for s in self.suggestions:
-                print(s)
+        response = self._suggestion_response()
+        if response is not None:
+            logger.info("Suggestions for '%s': %s", self.symbol, self.suggestions)
             return
 
         if not self.search_id:
-            print("Search ID not available.")
+            logger.warning("Search ID not available for '%s'", self.symbol)
             return
 
-        try:
-            data = api_info(self.search_id, debug=debug)
-            print(data)
-        except Exception as e:
-            print(f"Failed to fetch company details: {e}")
+        result = api_info(self.search_id, debug=debug)
+        if result["error"]:
+            if _rejects_id(result["error"]):
+                self._forget_resolution()
+            logger.error("Failed to fetch company details: %s", result["error"][0])
+        else:
+            print(result if debug else result["data"])
 
     def events(self, debug: bool = False) -> dict:
         """
@@ -236,24 +416,14 @@ class Ticker:
         debug_logs = []
         
         if debug:
-            debug_logs.append(f"[DEBUG] Function: events")
+            debug_logs.append("[DEBUG] Function: events")
             debug_logs.append(f"[DEBUG] Symbol: {self.symbol}")
             debug_logs.append(f"[DEBUG] Groww ID: {self.groww_id}")
             debug_logs.append(f"[DEBUG] Has suggestions: {bool(self.suggestions)}")
         
-        # Handle case where suggestions exist
-        if self.suggestions:
-            suggestion_messages = [f"Suggestions for '{self.symbol}':"] + [str(s) for s in self.suggestions]
-            
-            if debug:
-                debug_logs.append(f"[DEBUG] Returning suggestions instead of events")
-                debug_logs.extend([f"[DEBUG] {msg}" for msg in suggestion_messages])
-            
-            return {
-                "data": None,
-                "debug_info": debug_logs if debug else None,
-                "error": suggestion_messages
-            }
+        response = self._suggestion_response(debug_logs if debug else None)
+        if response is not None:
+            return response
         
         # Fetch events using api_events
         try:
@@ -283,17 +453,6 @@ class Ticker:
                 "debug_info": debug_logs if debug else None,
                 "error": [error_msg]
             }
-        
-        except Exception as e:
-            error_msg = f"Unexpected error: {str(e)}"
-            if debug:
-                debug_logs.append(f"[DEBUG] Unexpected Exception: {error_msg}")
-            
-            return {
-                "data": None,
-                "debug_info": debug_logs if debug else None,
-                "error": [error_msg]
-            }
     
     
     def news(self, page: int = 0, size: int = 10, debug: bool = False) -> dict:
@@ -316,24 +475,14 @@ class Ticker:
         debug_logs = []
         
         if debug:
-            debug_logs.append(f"[DEBUG] Function: news")
+            debug_logs.append("[DEBUG] Function: news")
             debug_logs.append(f"[DEBUG] Symbol: {self.symbol}")
             debug_logs.append(f"[DEBUG] Groww ID: {self.groww_id}")
             debug_logs.append(f"[DEBUG] Has suggestions: {bool(self.suggestions)}")
         
-        # Handle case where suggestions exist
-        if self.suggestions:
-            suggestion_messages = [f"Suggestions for '{self.symbol}':"] + [str(s) for s in self.suggestions]
-            
-            if debug:
-                debug_logs.append(f"[DEBUG] Returning suggestions instead of news")
-                debug_logs.extend([f"[DEBUG] {msg}" for msg in suggestion_messages])
-            
-            return {
-                "data": None,
-                "debug_info": debug_logs if debug else None,
-                "error": suggestion_messages
-            }
+        response = self._suggestion_response(debug_logs if debug else None)
+        if response is not None:
+            return response
         
         # Fetch news using api_news
         try:
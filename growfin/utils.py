@@ -1,17 +1,49 @@
-from .constants import API_LOOKBACK_LIMITS, BATCH_LIMITS, SUPPORTED_INTERVALS, SUPPORTED_LIVE_INTERVALS
+from __future__ import annotations
+
+from .constants import (
+    API_LOOKBACK_LIMITS, BATCH_LIMITS, SUPPORTED_INTERVALS, SUPPORTED_INTERVALS_ORDERED, SUPPORTED_LIVE_INTERVALS,
+    SUPPORTED_LIVE_INTERVALS_ORDERED, IST_UTC_OFFSET_SECONDS
+)
+from .market_calendar import today_ist
 import logging
 import re
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-import pandas as pd
-import pytz
+from datetime import date, datetime, timedelta, tzinfo, timezone as dt_timezone
+from functools import lru_cache
+from itertools import chain
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 import tzlocal
 
+try:
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+except ImportError:  # Python < 3.9
+    from backports.zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # ciso8601 is an optional C parser; strptime is used without it
+    _parse_iso = None
+
+# numpy/pandas are only needed to build DataFrames; they are imported on first use
+# so `import growfin` stays cheap for callers that only fetch raw JSON
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
 
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Day number of 1970-01-01, for turning dates into Unix seconds without a timezone lookup
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+_ONE_MS = timedelta(milliseconds=1)
+
+# Strict zero-padded 'YYYY-MM-DD'; strptime alone also accepts e.g. '2024-1-5'
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+# Zero-padded 'YYYY-MM-DD HH:MM'; only strings of this exact shape take the ciso8601 path
+_DATETIME_RE = re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}$')
+
 
 class DateTimeValidationError(ValueError):
     """Custom exception for datetime validation errors."""
@@ -23,14 +55,17 @@ class ParameterValidationError(ValueError):
     pass
 
 #start data_to_dataframe with helper function
-def data_to_dataframe(data: Dict) -> pd.DataFrame:
+def data_to_dataframe(data: Dict, validate: bool = True) -> pd.DataFrame:
     """
     Convert Groww API candle data (possibly wrapped inside 'data') into a pandas DataFrame with IST times.
+
+    With `validate=False` the payload is trusted: malformed candles raise ValueError
+    instead of being filtered out or coerced to NaN.
     """
 
     # Input validation
     if not isinstance(data, dict):
-        logger.error(f"Expected dict, got {type(data).__name__}")
+        logger.error("Expected dict, got %s", type(data).__name__)
         raise TypeError(f"Data must be a dictionary, got {type(data).__name__}")
 
     # Unwrap if the structure contains a top-level "data" key
@@ -45,29 +80,33 @@ def data_to_dataframe(data: Dict) -> pd.DataFrame:
         logger.warning("Empty candles data provided")
         return _create_empty_dataframe()
 
-    # Filter valid candle entries
-    valid_candles = _filter_valid_candles(data['candles'])
-    if not valid_candles:
-        logger.warning("No valid candles data after filtering")
-        return _create_empty_dataframe()
+    if not validate:
+        df = _frame_from_array(_pack_trusted_candles(data['candles']))
+        logger.info("Successfully converted %s candles to DataFrame", len(df))
+        return df
 
-    # Create DataFrame
-    df = pd.DataFrame(
-        valid_candles,
-        columns=['unix_timestamp', 'open', 'high', 'low', 'close', 'volume']
-    )
-
-    # Convert timestamp to IST and insert as second column
-    df.insert(1, 'time_ist', _convert_timestamp_to_ist(df['unix_timestamp']))
+    # Well-formed payloads are validated and packed in one NumPy pass; only
+    # irregular ones go through the per-candle filter
+    arr = _pack_regular_candles(data['candles'])
+    if arr is not None:
+        df = _frame_from_array(arr)
+    else:
+        # Filter valid candle entries
+        valid_candles = _filter_valid_candles(data['candles'])
+        if not valid_candles:
+            logger.warning("No valid candles data after filtering")
+            return _create_empty_dataframe()
 
-    # Ensure numeric data types
-    df = _ensure_numeric_columns(df)
+        # Create DataFrame
+        df = _build_candle_frame(valid_candles)
 
-    logger.info(f"Successfully converted {len(df)} candles to DataFrame")
+    logger.info("Successfully converted %s candles to DataFrame", len(df))
     return df
 
 def _create_empty_dataframe() -> pd.DataFrame:
     """Create empty DataFrame with expected column structure."""
+    import pandas as pd
+
     return pd.DataFrame(
         columns=['unix_timestamp', 'time_ist', 'open', 'high', 'low', 'close', 'volume']
     )
@@ -81,31 +120,151 @@ def _filter_valid_candles(candles: List) -> List:
     ]
 
 
+# Rows converted per NumPy call for very large payloads; keeps the per-call
+# temporaries a few MB instead of scaling with the whole response
+_PACK_TILE_ROWS = 65536
+
+
+def _candles_to_float_array(candles: List) -> np.ndarray:
+    """
+    np.asarray(candles, dtype=float64), tiled for large payloads: each tile is converted
+    on its own and copied into one preallocated (N, 6) array.
+
+    Raises TypeError/ValueError like np.asarray when the candles are not numeric rows;
+    a large payload that is not (N, 6) raises ValueError.
+    """
+    import numpy as np
+
+    if len(candles) <= _PACK_TILE_ROWS:
+        return np.asarray(candles, dtype=np.float64)
+
+    out = np.empty((len(candles), 6), dtype=np.float64)
+    for start in range(0, len(candles), _PACK_TILE_ROWS):
+        tile = np.asarray(candles[start:start + _PACK_TILE_ROWS], dtype=np.float64)
+        if tile.shape[1:] != (6,):
+            raise ValueError(f"Expected candles of shape (N, 6), got a tile of shape {tile.shape}")
+        out[start:start + len(tile)] = tile
+    return out
+
+
+def _pack_regular_candles(candles: List) -> Optional[np.ndarray]:
+    """
+    Convert the raw candle list to an (N, 6) float64 array when every entry is a
+    numeric 6-element row with a timestamp; return None so the caller filters otherwise.
+    """
+    import numpy as np
+
+    try:
+        arr = _candles_to_float_array(candles)
+    except (TypeError, ValueError):
+        return None
+
+    if arr.ndim != 2 or arr.shape[1] != 6 or np.isnan(arr[:, 0]).any():
+        return None
+    return arr
+
+
+def _pack_trusted_candles(candles: List) -> np.ndarray:
+    """Convert the raw candle list straight to an (N, 6) float64 array, raising ValueError if it is not one."""
+    try:
+        arr = _candles_to_float_array(candles)
+    except TypeError as e:
+        raise ValueError(f"Candles are not numeric: {e}") from e
+
+    if arr.ndim != 2 or arr.shape[1] != 6:
+        raise ValueError(f"Expected candles of shape (N, 6), got {arr.shape}")
+    return arr
+
+
+def _pack_candles(candles: List) -> np.ndarray:
+    """
+    Pack validated 6-element candles into an (N, 6) float64 array.
+
+    Streams the flattened values straight into a preallocated buffer, which skips
+    the nested-sequence shape discovery `np.asarray` performs on a list of lists.
+    """
+    import numpy as np
+
+    return np.fromiter(
+        chain.from_iterable(candles), dtype=np.float64, count=len(candles) * 6
+    ).reshape(-1, 6)
+
+
+def _build_candle_frame(candles: List) -> pd.DataFrame:
+    """
+    Build the candle DataFrame column by column from one contiguous float64 array.
+
+    Falls back to per-column coercion when the payload holds values NumPy
+    cannot cast to float (e.g. non-numeric strings) or missing timestamps.
+    """
+    import numpy as np
+    import pandas as pd
+
+    try:
+        arr = _pack_candles(candles)
+    except (TypeError, ValueError):
+        arr = None
+
+    if arr is None or np.isnan(arr[:, 0]).any():
+        df = pd.DataFrame(
+            candles,
+            columns=['unix_timestamp', 'open', 'high', 'low', 'close', 'volume']
+        )
+        # Convert timestamp to IST and insert as second column
+        df.insert(1, 'time_ist', _convert_timestamp_to_ist(df['unix_timestamp']))
+        # Ensure numeric data types
+        return _ensure_numeric_columns(df)
+
+    return _frame_from_array(arr)
+
+
+def _frame_from_array(arr: np.ndarray) -> pd.DataFrame:
+    """Build the typed candle DataFrame from an (N, 6) float64 array."""
+    import numpy as np
+    import pandas as pd
+
+    timestamps = pd.Series(arr[:, 0].astype(np.int64))
+    return pd.DataFrame({
+        'unix_timestamp': timestamps,
+        'time_ist': _convert_timestamp_to_ist(timestamps),
+        'open': arr[:, 1],
+        'high': arr[:, 2],
+        'low': arr[:, 3],
+        'close': arr[:, 4],
+        'volume': arr[:, 5]
+    })
+
+
 def _convert_timestamp_to_ist(timestamps: pd.Series) -> pd.Series:
     """Convert Unix timestamps to IST naive datetime objects."""
-    ist_tz = pytz.timezone('Asia/Kolkata')
-    return (
-        pd.to_datetime(timestamps, unit='s', utc=True)
-        .dt.tz_convert(ist_tz)
-        .dt.tz_localize(None)
-    )
+    import pandas as pd
+
+    # IST is a fixed UTC+05:30 with no DST, so a constant shift replaces the
+    # tz_convert/tz_localize round trip through a timezone database
+    if timestamps.dtype == 'int64':
+        # Clean integer seconds: one add and a cast, no datetime parsing at all
+        shifted = (timestamps.to_numpy() + IST_UTC_OFFSET_SECONDS).astype('datetime64[s]')
+        return pd.Series(shifted, index=timestamps.index)
+    return pd.to_datetime(timestamps, unit='s') + pd.Timedelta(seconds=IST_UTC_OFFSET_SECONDS)
 
 
 def _ensure_numeric_columns(df: pd.DataFrame) -> pd.DataFrame:
     """Convert price and volume columns to float type with error handling."""
+    import pandas as pd
+
     numeric_columns = ['open', 'high', 'low', 'close', 'volume']
-    
-    for col in numeric_columns:
-        original_na_count = df[col].isna().sum()
-        df[col] = pd.to_numeric(df[col], errors='coerce').astype(float)
-        new_na_count = df[col].isna().sum()
-        
-        if new_na_count > original_na_count:
-            logger.warning(
-                f"Column '{col}': {new_na_count - original_na_count} "
-                f"values converted to NaN due to invalid data"
-            )
-    
+
+    # Already-float columns need no coercion (and cannot gain NaNs from it)
+    if (df[numeric_columns].dtypes == 'float64').all():
+        return df
+
+    original_na_counts = df[numeric_columns].isna().sum()
+    df[numeric_columns] = df[numeric_columns].apply(pd.to_numeric, errors='coerce').astype(float)
+    added_na_counts = df[numeric_columns].isna().sum() - original_na_counts
+
+    for col, added in added_na_counts[added_na_counts > 0].items():
+        logger.warning("Column '%s': %s values converted to NaN due to invalid data", col, added)
+
     return df
 
 # start validate_datetime_format with helper function 
@@ -134,23 +293,25 @@ def validate_datetime_format(dt_str: str) -> datetime:
         2023-12-25
     """
     if not isinstance(dt_str, str):
-        logger.error(f"Expected string input, got {type(dt_str).__name__}")
+        logger.error("Expected string input, got %s", type(dt_str).__name__)
         raise TypeError(f"Input must be a string, got {type(dt_str).__name__}")
     
     # Validate format using regex for additional safety
-    date_pattern = re.compile(r'^\d{4}-\d{2}-\d{2}$')
-    if not date_pattern.match(dt_str):
-        logger.error(f"Invalid date format: '{dt_str}'. Expected 'YYYY-MM-DD'")
+    if not _DATE_RE.match(dt_str):
+        logger.error("Invalid date format: '%s'. Expected 'YYYY-MM-DD'", dt_str)
         raise DateTimeValidationError(
             f"Invalid date format: '{dt_str}'. Expected 'YYYY-MM-DD'"
         )
     
     try:
-        parsed_date = datetime.strptime(dt_str, '%Y-%m-%d')
-        logger.debug(f"Successfully validated date: {dt_str}")
+        if _parse_iso is not None:
+            parsed_date = _parse_iso(dt_str)
+        else:
+            parsed_date = datetime.strptime(dt_str, '%Y-%m-%d')
+        logger.debug("Successfully validated date: %s", dt_str)
         return parsed_date
     except ValueError as e:
-        logger.error(f"Invalid date value: '{dt_str}' - {str(e)}")
+        logger.error("Invalid date value: '%s' - %s", dt_str, e)
         raise DateTimeValidationError(
             f"Invalid date value: '{dt_str}'. Please provide a valid calendar date."
         ) from e
@@ -179,7 +340,7 @@ def convert_to_unixtimestamp(
     Raises:
         TypeError: If date_time is not a string
         DateTimeValidationError: If datetime format is invalid
-        ValueError: If timezone is unknown
+        ValueError: If timezone is unknown, or not given and the local zone cannot be determined
     
     Example:
         >>> timestamp = convert_to_unixtimestamp('2023-12-25 10:30', 'Asia/Kolkata')
@@ -187,7 +348,7 @@ def convert_to_unixtimestamp(
         True
     """
     if not isinstance(date_time, str):
-        logger.error(f"Expected string input, got {type(date_time).__name__}")
+        logger.error("Expected string input, got %s", type(date_time).__name__)
         raise TypeError(
             f"DateTime input must be a string in 'YYYY-MM-DD HH:MM' format, "
             f"got {type(date_time).__name__}"
@@ -195,10 +356,15 @@ def convert_to_unixtimestamp(
     
     # Validate and parse datetime
     try:
-        dt = datetime.strptime(date_time, '%Y-%m-%d %H:%M')
-        logger.debug(f"Successfully parsed datetime: {date_time}")
+        # ciso8601 is more lenient than the format string, so anything else
+        # (e.g. unpadded fields) keeps strptime's exact behaviour
+        if _parse_iso is not None and _DATETIME_RE.match(date_time):
+            dt = _parse_iso(date_time)
+        else:
+            dt = datetime.strptime(date_time, '%Y-%m-%d %H:%M')
+        logger.debug("Successfully parsed datetime: %s", date_time)
     except ValueError as e:
-        logger.error(f"Invalid datetime format: '{date_time}'")
+        logger.error("Invalid datetime format: '%s'", date_time)
         raise DateTimeValidationError(
             f"Invalid datetime format: '{date_time}'. Expected 'YYYY-MM-DD HH:MM'"
         ) from e
@@ -206,29 +372,42 @@ def convert_to_unixtimestamp(
     # Resolve timezone
     target_tz = _resolve_timezone(timezone)
     
-    # Localize naive datetime
+    # Localize naive datetime; pytz zones (older tzlocal) still need localize()
     if dt.tzinfo is None:
-        localized_dt = target_tz.localize(dt)
+        if hasattr(target_tz, 'localize'):
+            localized_dt = target_tz.localize(dt)
+        else:
+            localized_dt = dt.replace(tzinfo=target_tz)
     else:
         localized_dt = dt.astimezone(target_tz)
     
-    timestamp_ms = int(localized_dt.timestamp() * 1000)
-    logger.debug(f"Converted '{date_time}' to timestamp: {timestamp_ms}")
+    # Exact integer timedelta division; no float round trip through .timestamp()
+    timestamp_ms = (localized_dt - _EPOCH_UTC) // _ONE_MS
+    logger.debug("Converted '%s' to timestamp: %s", date_time, timestamp_ms)
     
     return timestamp_ms
 
 
-def _resolve_timezone(timezone: Optional[str]) -> pytz.BaseTzInfo:
-    """Resolve timezone string to pytz timezone object."""
+@lru_cache(maxsize=32)
+def _named_timezone(timezone: str) -> ZoneInfo:
+    """Build each named zone once; generate_parameters asks for 'Asia/Kolkata' twice per batch."""
+    return ZoneInfo(timezone)
+
+
+def _resolve_timezone(timezone: Optional[str]) -> tzinfo:
+    """Resolve timezone string to a tzinfo object (the local zone when not given)."""
     if timezone:
         try:
-            return pytz.timezone(timezone)
-        except pytz.UnknownTimeZoneError as e:
-            logger.error(f"Unknown timezone: '{timezone}'")
+            return _named_timezone(timezone)
+        except (ZoneInfoNotFoundError, ValueError) as e:
+            logger.error("Unknown timezone: '%s'", timezone)
             raise ValueError(f"Unknown timezone: '{timezone}'") from e
     else:
         local_tz = tzlocal.get_localzone()
-        logger.debug(f"Using local timezone: {local_tz}")
+        if local_tz is None:
+            logger.error("Could not determine the local timezone")
+            raise ValueError("Could not determine the local timezone; pass one explicitly")
+        logger.debug("Using local timezone: %s", local_tz)
         return local_tz
 
 
@@ -237,8 +416,9 @@ def validate_parameters(
     lookback_days: Optional[int] = None,
     start_date_str: Optional[str] = None,
     end_date_str: Optional[str] = None,
-    debug: bool = False
-) -> None:
+    debug: bool = False,
+    now: Optional[datetime] = None
+) -> Optional[Tuple[datetime, datetime]]:
     """
     Validate API parameters for time series data requests.
     
@@ -252,6 +432,11 @@ def validate_parameters(
         start_date_str (str, optional): Start date in 'YYYY-MM-DD' format
         end_date_str (str, optional): End date in 'YYYY-MM-DD' format
         debug (bool): Enable debug output
+        now (datetime, optional): Reference time for the range checks; defaults to datetime.now()
+    
+    Returns:
+        Optional[Tuple[datetime, datetime]]: The parsed (start, end) of a date-range
+            request, so callers need not parse the strings again; None for lookback.
     
     Raises:
         ParameterValidationError: If any validation rule is violated
@@ -269,25 +454,25 @@ def validate_parameters(
         >>> validate_parameters(5, start_date_str='2023-01-01', end_date_str='2023-01-31')  # Valid
     """
     if debug:
-        print(f"🔍 [DEBUG] Starting parameter validation...")
+        print("🔍 [DEBUG] Starting parameter validation...")
         print(f"   - interval_minutes: {interval_minutes}")
         print(f"   - lookback_days: {lookback_days}")
         print(f"   - start_date_str: {start_date_str}")
         print(f"   - end_date_str: {end_date_str}")
     
     logger.debug(
-        f"Validating parameters: interval={interval_minutes}, "
-        f"lookback={lookback_days}, start={start_date_str}, end={end_date_str}"
+        "Validating parameters: interval=%s, lookback=%s, start=%s, end=%s",
+        interval_minutes, lookback_days, start_date_str, end_date_str
     )
     
     # Validate interval support
     if debug:
-        print(f"🎯 [DEBUG] Checking interval support...")
+        print("🎯 [DEBUG] Checking interval support...")
     
     if interval_minutes not in SUPPORTED_INTERVALS:
         error_msg = (
             f"Interval {interval_minutes} minutes is not supported. "
-            f"Supported intervals: {sorted(SUPPORTED_INTERVALS)}"
+            f"Supported intervals: {list(SUPPORTED_INTERVALS_ORDERED)}"
         )
         if debug:
             print(f"❌ [DEBUG] Interval validation FAILED: {error_msg}")
@@ -302,7 +487,7 @@ def validate_parameters(
     has_date_range = start_date_str is not None or end_date_str is not None
     
     if debug:
-        print(f"🎯 [DEBUG] Checking parameter combination logic...")
+        print("🎯 [DEBUG] Checking parameter combination logic...")
         print(f"   - has_lookback: {has_lookback}")
         print(f"   - has_date_range: {has_date_range}")
     
@@ -326,29 +511,42 @@ def validate_parameters(
         raise ParameterValidationError(error_msg)
     
     if debug:
-        print(f"✅ [DEBUG] Parameter combination is valid")
+        print("✅ [DEBUG] Parameter combination is valid")
     
+    # API limit for this interval, looked up once for both constraint checks
+    max_days = API_LOOKBACK_LIMITS[interval_minutes]
+
     # Validate lookback constraints
     if has_lookback:
         if debug:
-            print(f"🎯 [DEBUG] Validating lookback constraints...")
-        _validate_lookback_constraints(interval_minutes, lookback_days, debug)
+            print("🎯 [DEBUG] Validating lookback constraints...")
+        _validate_lookback_constraints(interval_minutes, lookback_days, debug, max_days)
     
     # Validate date range constraints
+    date_range = None
     if start_date_str and end_date_str:
         if debug:
-            print(f"🎯 [DEBUG] Validating date range constraints...")
-        _validate_date_range_constraints(interval_minutes, start_date_str, end_date_str, debug)
+            print("🎯 [DEBUG] Validating date range constraints...")
+        date_range = _validate_date_range_constraints(
+            interval_minutes, start_date_str, end_date_str, debug, now, max_days
+        )
     
     if debug:
-        print(f"✅ [DEBUG] All parameter validations PASSED")
+        print("✅ [DEBUG] All parameter validations PASSED")
     
     logger.info("Parameter validation successful")
+    return date_range
 
 
-def _validate_lookback_constraints(interval_minutes: int, lookback_days: int, debug: bool = False) -> None:
+def _validate_lookback_constraints(
+    interval_minutes: int,
+    lookback_days: int,
+    debug: bool = False,
+    max_days: Optional[int] = None
+) -> None:
     """Validate lookback period against API limits."""
-    max_days = API_LOOKBACK_LIMITS[interval_minutes]
+    if max_days is None:
+        max_days = API_LOOKBACK_LIMITS[interval_minutes]
     
     if debug:
         print(f"   - lookback_days: {lookback_days}")
@@ -365,16 +563,18 @@ def _validate_lookback_constraints(interval_minutes: int, lookback_days: int, de
         raise ParameterValidationError(error_msg)
     
     if debug:
-        print(f"✅ [DEBUG] Lookback constraint validation PASSED")
+        print("✅ [DEBUG] Lookback constraint validation PASSED")
 
 
 def _validate_date_range_constraints(
     interval_minutes: int, 
     start_date_str: str, 
     end_date_str: str,
-    debug: bool = False
-) -> None:
-    """Validate date range against API limits and logical constraints."""
+    debug: bool = False,
+    now: Optional[datetime] = None,
+    max_days: Optional[int] = None
+) -> Tuple[datetime, datetime]:
+    """Validate date range against API limits and logical constraints; returns the parsed (start, end)."""
     if debug:
         print(f"   - Parsing start_date: {start_date_str}")
         print(f"   - Parsing end_date: {end_date_str}")
@@ -399,11 +599,13 @@ def _validate_date_range_constraints(
         raise ParameterValidationError(error_msg)
     
     if debug:
-        print(f"✅ [DEBUG] Date order is valid")
+        print("✅ [DEBUG] Date order is valid")
     
     # Validate against API limits
-    max_days = API_LOOKBACK_LIMITS[interval_minutes]
-    now = datetime.now()
+    if max_days is None:
+        max_days = API_LOOKBACK_LIMITS[interval_minutes]
+    if now is None:
+        now = datetime.now()
     
     start_age_days = (now - start_dt).days
     end_age_days = (now - end_dt).days
@@ -425,7 +627,9 @@ def _validate_date_range_constraints(
         raise ParameterValidationError(error_msg)
     
     if debug:
-        print(f"✅ [DEBUG] Date range constraint validation PASSED")
+        print("✅ [DEBUG] Date range constraint validation PASSED")
+
+    return start_dt, end_dt
 
 
 def create_batches(
@@ -433,7 +637,8 @@ def create_batches(
     lookback_days: Optional[int] = None,
     start_date_str: Optional[str] = None,
     end_date_str: Optional[str] = None,
-    debug: bool = False
+    debug: bool = False,
+    now: Optional[datetime] = None
 ) -> List[Dict[str, str]]:
     """
     Create time-based batches for API requests based on interval constraints.
@@ -448,6 +653,8 @@ def create_batches(
         start_date_str (str, optional): Start date in 'YYYY-MM-DD' format  
         end_date_str (str, optional): End date in 'YYYY-MM-DD' format
         debug (bool): Enable debug output
+        now (datetime, optional): Reference time shared by validation and batching;
+                                  defaults to datetime.now()
     
     Returns:
         List[Dict[str, str]]: List of batch dictionaries with 'start' and 'end' keys
@@ -463,28 +670,42 @@ def create_batches(
         >>> print(batches[0])    # {'start': '2023-11-01 00:01', 'end': '2023-11-30 23:59'}
     """
     if debug:
-        print(f"🔧 [DEBUG] Starting batch creation...")
+        print("🔧 [DEBUG] Starting batch creation...")
+
+    # One reference time, so validation and the lookback window agree on "now"
+    if now is None:
+        now = datetime.now()
     
     try:
-        validate_parameters(interval_minutes, lookback_days, start_date_str, end_date_str, debug)
+        date_range = validate_parameters(interval_minutes, lookback_days, start_date_str, end_date_str, debug, now)
     except ParameterValidationError as e:
         if debug:
             print(f"❌ [DEBUG] Batch creation FAILED due to validation error: {str(e)}")
-        logger.error(f"Batch creation failed due to validation error: {str(e)}")
+        logger.error("Batch creation failed due to validation error: %s", e)
         return []
     
     if debug:
-        print(f"✅ [DEBUG] Parameter validation PASSED, proceeding with batch creation...")
+        print("✅ [DEBUG] Parameter validation PASSED, proceeding with batch creation...")
     
     # Determine overall date range
-    start_date, end_date = _determine_date_range(lookback_days, start_date_str, end_date_str, debug)
+    start_date, end_date = _determine_date_range(lookback_days, date_range, debug, now)
     
+    return _create_batches_unchecked(interval_minutes, start_date, end_date, debug)
+
+
+def _create_batches_unchecked(
+    interval_minutes: int,
+    start_date: datetime,
+    end_date: datetime,
+    debug: bool = False
+) -> List[Dict[str, str]]:
+    """Split an already validated range into batches; see create_batches."""
     # Get batching configuration
     batch_config = BATCH_LIMITS[interval_minutes]
     max_days_per_batch = batch_config['max_days_per_request']
     
     if debug:
-        print(f"🔧 [DEBUG] Batch configuration:")
+        print("🔧 [DEBUG] Batch configuration:")
         print(f"   - max_days_per_batch: {max_days_per_batch}")
         print(f"   - overall_start_date: {start_date}")
         print(f"   - overall_end_date: {end_date}")
@@ -495,32 +716,44 @@ def create_batches(
     if debug:
         print(f"✅ [DEBUG] Created {len(batches)} batches successfully")
     
-    logger.info(f"Created {len(batches)} batches for {interval_minutes}-minute interval")
+    logger.info("Created %s batches for %s-minute interval", len(batches), interval_minutes)
     return batches
 
 
 def _determine_date_range(
     lookback_days: Optional[int],
-    start_date_str: Optional[str], 
-    end_date_str: Optional[str],
-    debug: bool = False
+    date_range: Optional[Tuple[datetime, datetime]],
+    debug: bool = False,
+    now: Optional[datetime] = None
 ) -> Tuple[datetime, datetime]:
     """Determine the overall start and end dates for batch creation."""
     if lookback_days is not None:
-        end_date = datetime.now()
+        end_date = now if now is not None else datetime.now()
         start_date = end_date - timedelta(days=lookback_days)
         if debug:
             print(f"🗓️ [DEBUG] Using lookback: {lookback_days} days from {end_date}")
-        logger.debug(f"Using lookback: {lookback_days} days from {end_date}")
+        logger.debug("Using lookback: %s days from %s", lookback_days, end_date)
     else:
-        start_date = validate_datetime_format(start_date_str)
-        end_date = validate_datetime_format(end_date_str)
+        # Parsed once by validate_parameters
+        start_date, end_date = date_range
         if debug:
             print(f"🗓️ [DEBUG] Using date range: {start_date} to {end_date}")
-        logger.debug(f"Using date range: {start_date} to {end_date}")
+        logger.debug("Using date range: %s to %s", start_date, end_date)
     
     return start_date, end_date
 
+def _batch_day_edges(start_day: int, end_day: int, max_days_per_batch: int) -> List[Tuple[int, int]]:
+    """
+    First and last day (proleptic ordinals) of each batch covering start_day..end_day.
+
+    Batches always span whole days, so the split is plain integer arithmetic.
+    """
+    return [
+        (day, min(day + max_days_per_batch - 1, end_day))
+        for day in range(start_day, end_day + 1, max_days_per_batch)
+    ]
+
+
 def _generate_batch_list(
     start_date: datetime, 
     end_date: datetime, 
@@ -529,25 +762,19 @@ def _generate_batch_list(
 ) -> List[Dict[str, str]]:
     """Generate list of batch dictionaries covering the date range."""
     batches = []
-    current_start = start_date
 
     if debug:
-        print(f"🔧 [DEBUG] Generating batches...")
+        print("🔧 [DEBUG] Generating batches...")
 
-    while current_start <= end_date:
-        # Batch start always at 00:01
-        batch_start = current_start.replace(hour=0, minute=1, second=0, microsecond=0)
-
-        # Calculate batch_end: max allowed or final day at 23:59
-        next_day = batch_start + timedelta(days=max_days_per_batch - 1)
-        batch_end = min(
-            next_day.replace(hour=23, minute=59, second=0, microsecond=0),
-            end_date.replace(hour=23, minute=59, second=0, microsecond=0)
-        )
+    if start_date > end_date:
+        return batches
 
+    for first_day, last_day in _batch_day_edges(start_date.toordinal(), end_date.toordinal(), max_days_per_batch):
+        # Batch start always at 00:01, batch end at 23:59 of its last day;
+        # isoformat() is the same 'YYYY-MM-DD' without strftime's format parsing
         batch_dict = {
-            'start': batch_start.strftime("%Y-%m-%d %H:%M"),
-            'end': batch_end.strftime("%Y-%m-%d %H:%M")
+            'start': date.fromordinal(first_day).isoformat() + " 00:01",
+            'end': date.fromordinal(last_day).isoformat() + " 23:59"
         }
         
         batches.append(batch_dict)
@@ -555,8 +782,7 @@ def _generate_batch_list(
         if debug:
             print(f"   - Batch {len(batches)}: {batch_dict}")
         
-        logger.debug(f"Created batch: {batch_start} to {batch_end}")
-        current_start = batch_end + timedelta(minutes=1)  # avoid overlap
+        logger.debug("Created batch: %s to %s", batch_dict['start'], batch_dict['end'])
 
     return batches
 
@@ -598,73 +824,124 @@ def generate_parameters(
         >>> print(params[0]['start_time'])  # 1640995200000 (example timestamp)
     """
     if debug:
-        print(f"🚀 [DEBUG] Starting parameter generation...")
+        # Debug runs rebuild the plan so every step is printed
+        return _build_parameters(interval, lookback, start_date, end_date, debug=True)
+
+    plan = _generate_parameters_cached(interval, lookback, start_date, end_date, datetime.now().date())
+    return [dict(params) for params in plan]
+
+
+@lru_cache(maxsize=256)
+def _generate_parameters_cached(
+    interval: int,
+    lookback: Optional[int],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    day: date
+) -> Tuple[Dict[str, int], ...]:
+    """
+    Memoized batch plan. Batches are whole days, so the plan only changes with the
+    calendar date; `day` is part of the key so the cache rolls over at midnight.
+    """
+    return tuple(_build_parameters(interval, lookback, start_date, end_date))
+
+
+def _build_parameters(
+    interval: int,
+    lookback: Optional[int],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    debug: bool = False
+) -> List[Dict[str, int]]:
+    """Validate, batch and convert to Unix timestamps; see generate_parameters."""
+    if debug:
+        print("🚀 [DEBUG] Starting parameter generation...")
         print(f"   - interval: {interval}")
         print(f"   - lookback: {lookback}")
         print(f"   - start_date: {start_date}")
         print(f"   - end_date: {end_date}")
     
-    logger.info(f"Generating parameters for interval={interval}, lookback={lookback}")
+    logger.info("Generating parameters for interval=%s, lookback=%s", interval, lookback)
+
+    now = datetime.now()
     
-    # Validate parameters
+    # Validate parameters (the only validation pass on this path)
     try:
-        validate_parameters(interval, lookback, start_date, end_date, debug)
+        date_range = validate_parameters(interval, lookback, start_date, end_date, debug, now)
     except ParameterValidationError as e:
         if debug:
             print(f"❌ [DEBUG] Parameter generation FAILED: {str(e)}")
-            print(f"🛑 [DEBUG] Breaking execution - validation failed")
-        logger.error(f"Parameter generation failed: {str(e)}")
+            print("🛑 [DEBUG] Breaking execution - validation failed")
+        logger.error("Parameter generation failed: %s", e)
         raise ValueError(f"Parameter validation failed: {str(e)}") from e
     
     if debug:
-        print(f"✅ [DEBUG] Validation PASSED, proceeding to batch creation...")
+        print("✅ [DEBUG] Validation PASSED, proceeding to batch creation...")
     
-    # Create batches
-    batches = create_batches(interval, lookback, start_date, end_date, debug)
+    # Create batches from the already validated, already parsed range
+    range_start, range_end = _determine_date_range(lookback, date_range, debug, now)
+    batches = _create_batches_unchecked(interval, range_start, range_end, debug)
     
     if not batches:
         if debug:
-            print(f"❌ [DEBUG] No batches created, returning empty parameter list")
+            print("❌ [DEBUG] No batches created, returning empty parameter list")
         logger.warning("No batches created, returning empty parameter list")
         return []
     
     if debug:
-        print(f"🔧 [DEBUG] Converting batches to Unix timestamps...")
+        print("🔧 [DEBUG] Converting batches to Unix timestamps...")
     
     # Convert datetime strings to Unix timestamps and format result parameters
+    try:
+        start_timestamps, end_timestamps = _ist_strings_to_unix_ms(batches)
+    except ValueError as e:
+        error_msg = f"Timestamp conversion failed for batches {batches}: {str(e)}"
+        if debug:
+            print(f"❌ [DEBUG] {error_msg}")
+        logger.error("Failed to convert batch timestamps: %s", e)
+        raise ValueError(error_msg) from e
+
     result = []
-    for i, batch in enumerate(batches):
-        try:
-            start_timestamp = convert_to_unixtimestamp(batch['start'], 'Asia/Kolkata')
-            end_timestamp = convert_to_unixtimestamp(batch['end'], 'Asia/Kolkata')
-            
-            param_dict = {
-                'interval': interval,
-                'start_time': start_timestamp,
-                'end_time': end_timestamp
-            }
-            
-            result.append(param_dict)
-            
-            if debug:
-                print(f"   - Batch {i+1}: {batch['start']} -> {start_timestamp}")
-                print(f"   - Batch {i+1}: {batch['end']} -> {end_timestamp}")
-            
-            logger.debug(f"Converted batch: {batch['start']} -> {start_timestamp}, {batch['end']} -> {end_timestamp}")
-            
-        except (DateTimeValidationError, ValueError) as e:
-            error_msg = f"Timestamp conversion failed for batch {batch}: {str(e)}"
-            if debug:
-                print(f"❌ [DEBUG] {error_msg}")
-            logger.error(f"Failed to convert timestamps for batch {batch}: {str(e)}")
-            raise ValueError(error_msg) from e
-    
+    for i, (batch, start_timestamp, end_timestamp) in enumerate(zip(batches, start_timestamps, end_timestamps)):
+        param_dict = {
+            'interval': interval,
+            'start_time': start_timestamp,
+            'end_time': end_timestamp
+        }
+
+        result.append(param_dict)
+
+        if debug:
+            print(f"   - Batch {i+1}: {batch['start']} -> {start_timestamp}")
+            print(f"   - Batch {i+1}: {batch['end']} -> {end_timestamp}")
+
+        logger.debug(
+            "Converted batch: %s -> %s, %s -> %s", batch['start'], start_timestamp, batch['end'], end_timestamp
+        )
+
     if debug:
         print(f"✅ [DEBUG] Successfully generated {len(result)} parameter sets with Unix timestamps")
     
-    logger.info(f"Generated {len(result)} parameter sets with Unix timestamps")
+    logger.info("Generated %s parameter sets with Unix timestamps", len(result))
     return result
 
+def _ist_strings_to_unix_ms(batches: List[Dict[str, str]]) -> Tuple[List[int], List[int]]:
+    """
+    Convert every batch's 'YYYY-MM-DD HH:MM' IST start/end to Unix milliseconds in one pass.
+
+    NumPy parses the whole column of strings at once; IST's fixed UTC+05:30 offset then
+    replaces per-string timezone localization. Raises ValueError on a malformed string.
+    """
+    import numpy as np
+
+    stamps = np.array(
+        [batch['start'] for batch in batches] + [batch['end'] for batch in batches],
+        dtype='datetime64[m]'
+    )
+    millis = ((stamps.astype(np.int64) * 60 - IST_UTC_OFFSET_SECONDS) * 1000).tolist()
+    return millis[:len(batches)], millis[len(batches):]
+
+
 def generate_live_parameters(interval: int, debug: bool = False):
     """
     Generate parameters for live intervals using today's date and a fixed time window.
@@ -674,7 +951,8 @@ def generate_live_parameters(interval: int, debug: bool = False):
         debug (bool): Enable debug output
 
     Returns:
-        dict: Parameters dictionary from generate_parameters function.
+        list: A single parameters dictionary (as from generate_parameters) covering
+              today's IST session window, 00:01 to 23:59.
 
     Raises:
         ValueError: If interval is not supported.
@@ -683,24 +961,26 @@ def generate_live_parameters(interval: int, debug: bool = False):
         print(f"📡 [DEBUG] Generating live parameters for interval: {interval}")
     
     if interval not in SUPPORTED_LIVE_INTERVALS:
-        error_msg = f"Unsupported interval: {interval}. Supported intervals are: {SUPPORTED_LIVE_INTERVALS}"
+        error_msg = f"Unsupported interval: {interval}. Supported intervals are: {list(SUPPORTED_LIVE_INTERVALS_ORDERED)}"
         if debug:
             print(f"❌ [DEBUG] {error_msg}")
         raise ValueError(error_msg)
     
-    today_str = datetime.now().strftime('%Y-%m-%d')
-    start_date_str = f"{today_str}"
-    end_date_str = f"{today_str}"
-    
+    # A one-day window needs no validation, batching or string parsing: the
+    # 00:01 and 23:59 IST edges follow directly from today's day number
+    today = today_ist()
+    day_start_s = (today.toordinal() - _EPOCH_ORDINAL) * 86400 - IST_UTC_OFFSET_SECONDS
+
+    params = {
+        'interval': interval,
+        'start_time': (day_start_s + 60) * 1000,
+        'end_time': (day_start_s + 23 * 3600 + 59 * 60) * 1000
+    }
+
     if debug:
-        print(f"📡 [DEBUG] Using today's date: {today_str}")
-        print(f"📡 [DEBUG] Calling generate_parameters with live parameters...")
-
-    return generate_parameters(
-        interval=interval,
-        lookback=None,
-        start_date=start_date_str,
-        end_date=end_date_str,
-        debug=debug
-    )
+        print(f"📡 [DEBUG] Using today's date (IST): {today.isoformat()}")
+        print(f"   - Batch 1: {today.isoformat()} 00:01 -> {params['start_time']}")
+        print(f"   - Batch 1: {today.isoformat()} 23:59 -> {params['end_time']}")
+
+    return [params]
 
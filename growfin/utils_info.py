@@ -1,7 +1,183 @@
-from typing import Union
-from .api import call_nse_api, api_info
+import difflib
+import heapq
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple, Union
+from .api import call_nse_api, api_info, forget_api_lookup, _fan_out
+from .cache import TTLCache
+from .constants import SYMBOL_RESOLUTION_CACHE_TTL, SYMBOL_RESOLUTION_REFRESH_AFTER, SUGGESTION_LIMIT
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # rapidfuzz is an optional C ranker; difflib scores the candidates without it
+    process = None
+
+logger = logging.getLogger(__name__)
+
+# The in-process symbol resolution cache, which Ticker resolves through as well.
+# Successful lookups only, as (value, fetched_at) keyed by upper-cased ticker. Error
+# strings and suggestion lists are never cached, so a failed lookup is retried next time.
+_search_id_cache = TTLCache(maxsize=4096, ttl=SYMBOL_RESOLUTION_CACHE_TTL)
+_growid_cache = TTLCache(maxsize=4096, ttl=SYMBOL_RESOLUTION_CACHE_TTL)
+# search_id -> (groww_id, fetched_at), shared by tickers that resolve to the same company
+_growid_by_search_id = TTLCache(maxsize=4096, ttl=SYMBOL_RESOLUTION_CACHE_TTL)
+
+# Entries older than SYMBOL_RESOLUTION_REFRESH_AFTER are still served, but refreshed on
+# a small pool created on first use (and again in a forked child)
+_refresh_executor = None
+_refresh_executor_pid = None
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+
+# Where the payload sits, in order of precedence: inside the response envelope,
+# in a bare API payload, then at the root
+_CONTENT_PATHS = (("data", "data", "content"), ("data", "content"), ("content",))
+_HEADER_PATHS = (("data", "header"), ("header",))
+
+
+def _dig(obj, path):
+    """Follow `path` through nested dicts; None as soon as a level is missing or not a dict."""
+    for key in path:
+        if not isinstance(obj, dict):
+            return None
+        obj = obj.get(key)
+    return obj
+
+
+def _extract_content(response: dict) -> Tuple[Union[list, None], Union[tuple, None]]:
+    """
+    Return (content, path) for the first non-empty content list along _CONTENT_PATHS.
+
+    Spelled out key by key instead of walking the path table with _dig: this runs
+    for every search response. Returns (None, None) when no path has content.
+    Must stay equivalent to walking _CONTENT_PATHS (unit_test/testextractcontent.py).
+    """
+    data = response.get("data")
+    if isinstance(data, dict):
+        inner = data.get("data")
+        if isinstance(inner, dict):
+            content = inner.get("content")
+            if content:
+                return content, _CONTENT_PATHS[0]
+        content = data.get("content")
+        if content:
+            return content, _CONTENT_PATHS[1]
+    content = response.get("content")
+    if content:
+        return content, _CONTENT_PATHS[2]
+    return None, None
+
+
+def _path_label(name: str, path: tuple) -> str:
+    """Render a key path for debug output, e.g. response['data']['content']."""
+    return name + "".join(f"[{key!r}]" for key in path)
+
+
+def _closest_codes(
+    ticker: str,
+    candidates: List[Tuple[str, str]],
+    limit: int = SUGGESTION_LIMIT
+) -> List[Tuple[str, str]]:
+    """Return up to `limit` (code, title) candidates ranked by similarity of the code to `ticker`."""
+    codes = [code.upper() for code, _ in candidates]
+    if process is not None:
+        ranked = process.extract(ticker, codes, scorer=fuzz.WRatio, limit=limit)
+        return [candidates[index] for _, _, index in ranked]
+
+    matcher = difflib.SequenceMatcher(b=ticker, autojunk=False)
+
+    def score(index):
+        matcher.set_seq1(codes[index])
+        return matcher.ratio()
+
+    # nlargest is stable on ties, so equally close codes keep the API's order
+    return [candidates[index] for index in heapq.nlargest(limit, range(len(codes)), key=score)]
+
+
+def _get_refresh_executor() -> ThreadPoolExecutor:
+    """Return the background refresh pool, creating it on first use and after a fork."""
+    global _refresh_executor, _refresh_executor_pid
+
+    pid = os.getpid()
+    if _refresh_executor is not None and _refresh_executor_pid == pid:
+        return _refresh_executor
+
+    with _refreshing_lock:
+        if _refresh_executor is None or _refresh_executor_pid != pid:
+            # Refreshes in flight in the parent never finish in this process
+            _refreshing.clear()
+            _refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="growfin-refresh")
+            _refresh_executor_pid = pid
+
+    return _refresh_executor
+
+
+def _refresh(cache: TTLCache, key: Hashable, fetch: Callable[[str, bool], object]) -> None:
+    """Re-run `fetch` for a stale entry on the refresh pool; failures keep the stale value."""
+    try:
+        fetch(key, False)
+    except Exception as e:
+        logger.debug("Background refresh of %s failed: %r", key, e)
+    finally:
+        with _refreshing_lock:
+            _refreshing.discard((id(cache), key))
+
+
+def _cached_lookup(cache: TTLCache, key: str, fetch: Callable[[str, bool], object]):
+    """
+    Return the cached value for `key`, or None on a miss.
+
+    A value older than SYMBOL_RESOLUTION_REFRESH_AFTER is returned as is while `fetch`
+    re-resolves it in the background (at most one refresh per key at a time); the
+    entry only blocks callers again once SYMBOL_RESOLUTION_CACHE_TTL has passed.
+    """
+    entry = cache.get(key)
+    if entry is None:
+        return None
+
+    value, fetched_at = entry
+    if time.monotonic() - fetched_at >= SYMBOL_RESOLUTION_REFRESH_AFTER:
+        token = (id(cache), key)
+        executor = _get_refresh_executor()
+        with _refreshing_lock:
+            stale = token not in _refreshing
+            _refreshing.add(token)
+        if stale:
+            executor.submit(_refresh, cache, key, fetch)
+    return value
 
 
+def clear_lookup_cache() -> None:
+    """Forget every cached get_search_id/get_growid result."""
+    _search_id_cache.clear()
+    _growid_cache.clear()
+    _growid_by_search_id.clear()
+
+
+def forget_lookup(ticker: str, search_id: Optional[str] = None) -> None:
+    """
+    Forget the cached lookups of one ticker, e.g. after its IDs stopped working.
+
+    Drops its get_search_id/get_growid results and the cached search and company
+    info responses behind them (for `search_id` too, when given), so the next
+    lookup queries the API again.
+    """
+    key = ticker.upper()
+    search_ids = {search_id} if search_id else set()
+    entry = _search_id_cache.pop(key)
+    if entry is not None and entry[0].get("search_id"):
+        search_ids.add(entry[0]["search_id"])
+    _growid_cache.pop(key)
+
+    forget_api_lookup(ticker=ticker)
+    for known_id in search_ids:
+        _growid_by_search_id.pop(known_id)
+        forget_api_lookup(search_id=known_id)
+
 
 def get_search_id(ticker: str, debug: bool = False) -> Union[dict, str]:
     """
@@ -9,92 +185,83 @@ def get_search_id(ticker: str, debug: bool = False) -> Union[dict, str]:
 
     Args:
         ticker (str): NSE ticker symbol (e.g., 'RELIANCE')
-        debug (bool): Enable debug logging for API calls and function flow
+        debug (bool): Log the API call and function flow at DEBUG level on the `growfin` logger
 
     Returns:
         dict: If match found, includes nse_scrip_code, bse_scrip_code, search_id, and title.
-        dict: If no match, suggests possible similar tickers.
-        str : Error message if no content is returned.
+        dict: If no match, suggests the closest similar tickers (at most SUGGESTION_LIMIT).
+        str : Error message if the search request fails or no content is returned.
+
+    Exact matches are cached per ticker and refreshed in the background once they
+    are SYMBOL_RESOLUTION_REFRESH_AFTER old; debug calls always query the API.
     """
+    if not debug:
+        cached = _cached_lookup(_search_id_cache, ticker.upper(), _fetch_search_id)
+        if cached is not None:
+            return dict(cached)
+    return _fetch_search_id(ticker, debug)
+
+
+def _fetch_search_id(ticker: str, debug: bool) -> Union[dict, str]:
+    """get_search_id() without the cache lookup; an exact match is (re)stored in the cache."""
     if debug:
-        print(f"[DEBUG] get_search_id() called with arguments:")
-        print(f"  - ticker: {ticker}")
-        print(f"  - debug: {debug}")
+        logger.debug("get_search_id(ticker=%r, debug=%r)", ticker, debug)
     
     # Call API with debug parameter
     response = call_nse_api(ticker, debug=debug)
     
     if debug:
-        print(f"[DEBUG] API response received: {type(response)}")
-        print(f"[DEBUG] Response keys: {list(response.keys()) if isinstance(response, dict) else 'N/A'}")
-        print(f"[DEBUG] Full response structure: {response}")
-    
-    # FIXED: Correct content extraction for nested structure
-    content = None
-    
-    if isinstance(response, dict):
-        # Method 1: Try the nested structure (debug mode)
-        # response -> data -> data -> content
-        if "data" in response and isinstance(response["data"], dict):
-            data_level_1 = response["data"]
-            if "data" in data_level_1 and isinstance(data_level_1["data"], dict):
-                content = data_level_1["data"].get("content", [])
-                if debug:
-                    print(f"[DEBUG] Content extracted from response['data']['data']['content']: {len(content) if content else 0} items")
-        
-        # Method 2: Try direct content access (non-debug mode)
-        if not content:
-            # response -> data -> content (fallback for non-debug)
-            if "data" in response and isinstance(response["data"], dict):
-                content = response["data"].get("content", [])
-                if debug:
-                    print(f"[DEBUG] Content extracted from response['data']['content']: {len(content) if content else 0} items")
-        
-        # Method 3: Try root level content access
-        if not content:
-            content = response.get("content", [])
-            if debug:
-                print(f"[DEBUG] Content extracted from response['content']: {len(content) if content else 0} items")
+        logger.debug("Search API response: %s", response)
+
+    if response["error"]:
+        if debug:
+            logger.debug("Search request failed: %s", response["error"])
+        return f"Search request failed: {response['error'][0]}"
+
+    content, path = _extract_content(response)
+    if content and debug:
+        logger.debug("Content extracted from %s: %d items", _path_label("response", path), len(content))
 
     if not content:
         if debug:
-            print("[DEBUG] No content found in API response after trying all extraction methods")
-            print(f"[DEBUG] Full response structure for debugging:")
-            print(f"[DEBUG] {response}")
+            logger.debug("No content found in search response: %s", response)
         return "Please type a correct NSE symbol. No matches found."
 
     ticker = ticker.upper()
     if debug:
-        print(f"[DEBUG] Searching for ticker: {ticker}")
-        print(f"[DEBUG] Content items to search: {len(content)}")
+        logger.debug("Searching %d items for ticker %s", len(content), ticker)
 
+    # One pass: stop at the exact match, otherwise collect the candidates on the way
+    candidates = []
+    get = dict.get
     for item in content:
-        if debug:
-            print(f"[DEBUG] Checking item: {item.get('nse_scrip_code', 'N/A')}")
-        
-        if item.get("nse_scrip_code", "").upper() == ticker:
+        code = get(item, "nse_scrip_code")
+        if not code:
+            continue
+
+        if code.upper() == ticker:
             result = {
-                "nse_scrip_code": item.get("nse_scrip_code"),
+                "nse_scrip_code": code,
                 "bse_scrip_code": item.get("bse_scrip_code"),
                 "search_id": item.get("search_id"),
                 "title": item.get("title")
             }
             if debug:
-                print(f"[DEBUG] Exact match found: {result}")
+                logger.debug("Exact match found after %d candidates: %s", len(candidates), result)
+            _search_id_cache.set(ticker, (dict(result), time.monotonic()))
             return result
 
-    # No exact match found — build suggestions
+        candidates.append((code, get(item, "title")))
+
     suggestions = [
-        {
-            "nse_scrip_code": item.get("nse_scrip_code"),
-            "title": item.get("title")
-        }
-        for item in content
-        if item.get("nse_scrip_code")
+        {"nse_scrip_code": code, "title": title}
+        for code, title in _closest_codes(ticker, candidates)
     ]
-
     if debug:
-        print(f"[DEBUG] No exact match. Built {len(suggestions)} suggestions")
+        logger.debug(
+            "No exact match for %s; kept %d of %d candidates as suggestions",
+            ticker, len(suggestions), len(candidates)
+        )
 
     return {
         "message": "No exact match found. Are you looking for one of these?",
@@ -114,220 +281,165 @@ def get_growid(ticker: str, debug: bool = False) -> Union[str, dict, None]:
 
     Args:
         ticker (str): NSE symbol (e.g., 'RELIANCE')
-        debug (bool): Enable debug logging for API calls and function flow
+        debug (bool): Log the API calls and function flow at DEBUG level on the `growfin` logger
 
     Returns:
         str: Groww company ID (e.g., 'GSTK500325') if exact match found
         dict: Suggestions dictionary if no exact match found
         None: If error occurred or no content found
+
+    Resolved IDs are cached per ticker and refreshed in the background once they
+    are SYMBOL_RESOLUTION_REFRESH_AFTER old; debug calls always query the API.
     """
+    if not debug:
+        cached = _cached_lookup(_growid_cache, ticker.upper(), _fetch_growid)
+        if cached is not None:
+            return cached
+    return _fetch_growid(ticker, debug)
+
+
+def _fetch_growid(ticker: str, debug: bool) -> Union[str, dict, None]:
+    """get_growid() without the cache lookup; a resolved ID is (re)stored in the cache."""
     if debug:
-        print(f"[DEBUG] get_growid() called with arguments:")
-        print(f"  - ticker: {ticker}")
-        print(f"  - debug: {debug}")
-    
-    if debug:
-        print(f"[DEBUG] Looking up search_id for ticker: {ticker}")
+        logger.debug("get_growid(ticker=%r, debug=%r)", ticker, debug)
     
     search_result = get_search_id(ticker, debug=debug)
 
     if debug:
-        print(f"[DEBUG] get_search_id returned: {type(search_result)}")
-        if isinstance(search_result, dict):
-            print(f"[DEBUG] Keys in search_result: {list(search_result.keys())}")
-        else:
-            print(f"[DEBUG] search_result value: {search_result}")
-
-    # Handle string response (error message)
-    if isinstance(search_result, str):
-        if debug:
-            print(f"[DEBUG] String response received: {search_result}")
+        logger.debug("get_search_id returned: %r", search_result)
+
+    # Error message from the search
+    if not isinstance(search_result, dict):
         return None
 
     # If suggestions returned - RETURN SUGGESTIONS INSTEAD OF None
-    if isinstance(search_result, dict) and "suggestions" in search_result:
+    if "suggestions" in search_result:
         if debug:
-            print("[DEBUG] No exact match found, returning suggestions instead of None")
-            print(f"[DEBUG] Suggestions count: {len(search_result['suggestions'])}")
+            logger.debug("No exact match; returning %d suggestions", len(search_result["suggestions"]))
         # FIXED: Return suggestions dict instead of None for professional trading
         return search_result
 
-    # If exact match
-    if isinstance(search_result, dict) and "search_id" in search_result:
-        search_id = search_result["search_id"]
+    if "search_id" not in search_result:
         if debug:
-            print(f"[DEBUG] Exact match found, search_id: {search_id}")
+            logger.debug("Invalid response from get_search_id: %r", search_result)
+        return None
+
+    # Exact match
+    search_id = search_result["search_id"]
+    if not debug:
+        # Fresh entries only, so a background refresh of a stale ticker still reaches api_info
+        entry = _growid_by_search_id.get(search_id)
+        if entry is not None and time.monotonic() - entry[1] < SYMBOL_RESOLUTION_REFRESH_AFTER:
+            _growid_cache.set(ticker.upper(), entry)
+            return entry[0]
+
+    if debug:
+        logger.debug("Calling api_info with search_id: %s", search_id)
+
+    try:
+        info = api_info(search_id, debug=debug)
 
-        try:
+        if info["error"]:
             if debug:
-                print(f"[DEBUG] Calling api_info with search_id: {search_id}")
-            
-            info = api_info(search_id, debug=debug)
-            
+                logger.debug("api_info request failed: %s", info["error"])
+            return None
+
+        if debug:
+            logger.debug("api_info response: %s", info)
+        
+        # FIXED: Enhanced error handling for groww_id extraction with correct nested path
+        if not isinstance(info, dict):
             if debug:
-                print(f"[DEBUG] api_info response received")
-                print(f"[DEBUG] Response type: {type(info)}")
-                print(f"[DEBUG] Response keys: {list(info.keys()) if isinstance(info, dict) else 'N/A'}")
-                
-                # Enhanced debugging for api_info response
-                if isinstance(info, dict) and "header" in info:
-                    print(f"[DEBUG] Header keys: {list(info['header'].keys()) if isinstance(info['header'], dict) else 'N/A'}")
-                else:
-                    print(f"[DEBUG] Full info response structure: {info}")
-            
-            # FIXED: Enhanced error handling for groww_id extraction with correct nested path
-            if not isinstance(info, dict):
-                if debug:
-                    print(f"[DEBUG] api_info did not return a dict: {type(info)}")
-                return None
-            
-            # Handle nested structure: info -> data -> header -> growwCompanyId
-            header_data = None
-            
-            # Method 1: Try nested structure (debug mode) - info["data"]["header"]
-            if "data" in info and isinstance(info["data"], dict):
-                if "header" in info["data"] and isinstance(info["data"]["header"], dict):
-                    header_data = info["data"]["header"]
-                    if debug:
-                        print(f"[DEBUG] Header found in nested structure: info['data']['header']")
-            
-            # Method 2: Try direct access (non-debug mode) - info["header"]
-            if not header_data and "header" in info and isinstance(info["header"], dict):
-                header_data = info["header"]
-                if debug:
-                    print(f"[DEBUG] Header found in direct structure: info['header']")
-            
-            if not header_data:
-                if debug:
-                    print(f"[DEBUG] 'header' key not found in api_info response")
-                    print(f"[DEBUG] Available top-level keys: {list(info.keys())}")
-                    if "data" in info and isinstance(info["data"], dict):
-                        print(f"[DEBUG] Available data-level keys: {list(info['data'].keys())}")
-                return None
-            
-            if "growwCompanyId" not in header_data:
+                logger.debug("api_info did not return a dict: %s", type(info))
+            return None
+        
+        # Handle nested structure: info -> data -> header -> growwCompanyId
+        header_data = None
+        for path in _HEADER_PATHS:
+            candidate = _dig(info, path)
+            if isinstance(candidate, dict) and candidate:
+                header_data = candidate
                 if debug:
-                    print(f"[DEBUG] 'growwCompanyId' not found in header")
-                    print(f"[DEBUG] Header keys: {list(header_data.keys())}")
-                return None
-            
-            groww_id = header_data["growwCompanyId"]
-            
-            if debug:
-                print(f"[DEBUG] Successfully extracted groww_id: {groww_id}")
-            
-            return groww_id
-            
-        except KeyError as e:
+                    logger.debug("Header found at %s", _path_label("info", path))
+                break
+        
+        if not header_data:
             if debug:
-                print(f"[DEBUG] KeyError occurred: {e}")
-                print(f"[DEBUG] Available keys in info: {list(info.keys()) if isinstance(info, dict) else 'N/A'}")
+                logger.debug("'header' not found in api_info response")
             return None
-        except Exception as e:
+        
+        if "growwCompanyId" not in header_data:
             if debug:
-                print(f"[DEBUG] Exception occurred: {e}")
-                print(f"[DEBUG] Exception type: {type(e)}")
+                logger.debug("'growwCompanyId' not found in header: %s", header_data)
             return None
+        
+        groww_id = header_data["growwCompanyId"]
+        
+        if debug:
+            logger.debug("Successfully extracted groww_id: %s", groww_id)
 
-    if debug:
-        print("[DEBUG] Unexpected error: Invalid response from get_search_id")
-        print(f"[DEBUG] Received: {search_result}")
-    
-    return None
-
-
-# Test cases
-if __name__ == "__main__":
-    print("="*60)
-    print("TESTING WITH CORRECTED CONTENT EXTRACTION")
-    print("="*60)
-    
-    # Example 1: get exact match with debug false get search id
-    print("=== Test 1: RELIANCE without debug ===")
-    result1 = get_search_id("RELIANCE")
-    print(result1)
-
-    print("\n" + "="*50 + "\n")
-
-    # Example 2: get exact match with debug True get search id
-    print("=== Test 2: RELIANCE with debug ===")
-    result2 = get_search_id("RELIANCE", debug=True)
-    print(result2)
-
-    print("\n" + "="*50 + "\n")
-
-    # Example 3: get approx match with debug False get search id
-    print("=== Test 3: adani without debug ===")
-    result3 = get_search_id("adani")
-    print(result3)
-
-    print("\n" + "="*50 + "\n")
-
-    # Example 4: get approx match with debug True get search id
-    print("=== Test 4: adani with debug ===")
-    result4 = get_search_id("adani", debug=True)
-    print(result4)
-
-    print("\n" + "="*50 + "\n")
-
-    # Example 5: get invalid data with debug false get search id
-    print("=== Test 5: abc without debug ===")
-    result5 = get_search_id("abc")
-    print(result5)
-
-    print("\n" + "="*50 + "\n")
-
-    # Example 6: get invalid data with debug True get search id
-    print("=== Test 6: abc with debug ===")
-    result6 = get_search_id("abc", debug=True)
-    print(result6)
-
-    print("\n" + "="*50 + "\n")
-
-    # Get Grow id tests
-    print("=== Groww ID Tests ===")
-
-    # Example 7: get exact match with debug false get grow id
-    print("=== Test 7: RELIANCE growid without debug ===")
-    result7 = get_growid("RELIANCE")
-    print(result7)
-
-    print("\n" + "="*50 + "\n")
+        if isinstance(groww_id, str):
+            entry = (groww_id, time.monotonic())
+            _growid_cache.set(ticker.upper(), entry)
+            _growid_by_search_id.set(search_id, entry)
+        return groww_id
+        
+    except KeyError as e:
+        if debug:
+            logger.debug("KeyError while reading api_info response: %s", e)
+        return None
+    except Exception as e:
+        if debug:
+            logger.debug("Unexpected error while resolving groww_id: %r", e)
+        return None
 
-    # Example 8: get exact match with debug True get grow id
-    print("=== Test 8: RELIANCE growid with debug ===")
-    result8 = get_growid("RELIANCE", debug=True)
-    print(result8)
 
-    print("\n" + "="*50 + "\n")
+def get_growids(
+    tickers: Iterable[str],
+    max_workers: int = 16,
+    debug: bool = False
+) -> Dict[str, Union[str, dict, None]]:
+    """
+    Resolve the Groww company ID for many tickers concurrently.
 
-    # Example 9: get approx match with debug False get grow id
-    print("=== Test 9: adani growid without debug ===")
-    result9 = get_growid("adani")
-    print(result9)
+    Each distinct ticker runs `get_growid()` on a thread pool over the shared HTTP
+    session, so the search and info round trips overlap instead of queueing.
 
-    print("\n" + "="*50 + "\n")
+    Args:
+        tickers (iterable): NSE symbols (e.g., ['RELIANCE', 'TCS'])
+        max_workers (int): Maximum number of lookups in flight at once
+        debug (bool): Passed through to `get_growid()`
 
-    # Example 10: get approx match with debug True get grow id
-    print("=== Test 10: adani growid with debug ===")
-    result10 = get_growid("adani", debug=True)
-    print(result10)
+    Returns:
+        dict: Ticker -> `get_growid()` result, in first-seen input order
+    """
+    unique = list(dict.fromkeys(tickers))
+    results = _fan_out(get_growid, ((ticker,) for ticker in unique), max_workers, debug=debug)
+    return dict(zip(unique, results))
 
-    print("\n" + "="*50 + "\n")
 
-    # Example 11: get invalid data with debug false get grow id
-    print("=== Test 11: abc growid without debug ===")
-    result11 = get_growid("abc")
-    print(result11)
+# Test cases
+if __name__ == "__main__":
+    print("="*60)
+    print("TESTING WITH CORRECTED CONTENT EXTRACTION")
+    print("="*60)
 
-    print("\n" + "="*50 + "\n")
+    # debug=True cases report through the growfin logger
+    logging.basicConfig()
+    logging.getLogger("growfin").setLevel(logging.DEBUG)
 
-    # Example 12: get invalid data with debug True get grow id
-    print("=== Test 12: abc growid with debug ===")
-    result12 = get_growid("abc", debug=True)
-    print(result12)
+    # Exact match, approximate match and invalid symbol, each without and with debug
+    CASES = [
+        (fn, ticker, debug)
+        for fn in (get_search_id, get_growid)
+        for ticker in ("RELIANCE", "adani", "abc")
+        for debug in (False, True)
+    ]
 
-    print("\n" + "="*60 + "\n")
+    for number, (fn, ticker, debug) in enumerate(CASES, 1):
+        print(f"=== Test {number}: {fn.__name__}({ticker!r}, debug={debug}) ===")
+        print(fn(ticker, debug=debug))
+        print("\n" + "="*50 + "\n")
 
 
 # Additional diagnostic function to confirm the structure
@@ -338,27 +450,20 @@ def diagnose_api_structure():
     print("="*60)
     
     ticker = "RELIANCE"
-    
-    print("Without debug:")
-    response_no_debug = call_nse_api(ticker, debug=False)
-    print(f"Type: {type(response_no_debug)}")
-    print(f"Keys: {list(response_no_debug.keys()) if isinstance(response_no_debug, dict) else 'N/A'}")
-    if isinstance(response_no_debug, dict) and "data" in response_no_debug:
-        print(f"Data keys: {list(response_no_debug['data'].keys()) if isinstance(response_no_debug['data'], dict) else 'N/A'}")
-    
-    print("\nWith debug:")
-    response_with_debug = call_nse_api(ticker, debug=True)
-    print(f"Type: {type(response_with_debug)}")
-    print(f"Keys: {list(response_with_debug.keys()) if isinstance(response_with_debug, dict) else 'N/A'}")
-    if isinstance(response_with_debug, dict) and "data" in response_with_debug:
-        data_level_1 = response_with_debug['data']
-        print(f"Data level 1 keys: {list(data_level_1.keys()) if isinstance(data_level_1, dict) else 'N/A'}")
-        if isinstance(data_level_1, dict) and "data" in data_level_1:
-            data_level_2 = data_level_1['data']
-            print(f"Data level 2 keys: {list(data_level_2.keys()) if isinstance(data_level_2, dict) else 'N/A'}")
-            if isinstance(data_level_2, dict) and "content" in data_level_2:
-                content = data_level_2['content']
-                print(f"Content items: {len(content) if isinstance(content, list) else 'Not a list'}")
+
+    # debug only adds debug_info to the envelope, so one fetch describes both shapes
+    response = call_nse_api(ticker, debug=True)
+    print(f"Type: {type(response)}")
+    print(f"Envelope keys: {list(response.keys()) if isinstance(response, dict) else 'N/A'}")
+
+    for label, path in (("Data level 1", ("data",)), ("Data level 2", ("data", "data"))):
+        level = _dig(response, path)
+        print(f"{label} keys: {list(level.keys()) if isinstance(level, dict) else 'N/A'}")
+
+    content, path = _extract_content(response)
+    if content is not None:
+        print(f"Content items at {_path_label('response', path)}: "
+              f"{len(content) if isinstance(content, list) else 'Not a list'}")
     
     print("="*60)
 
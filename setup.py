@@ -7,12 +7,19 @@ setup(
     author='Subham Giri',
     author_email='your_email@example.com',
     packages=find_packages(),
+    package_data={'growfin': ['data/*.json']},
     install_requires=[
         'requests',
+        'numpy',
         'pandas',
-        'pytz',
-        'tzlocal'
+        'tzlocal',
+        'backports.zoneinfo; python_version < "3.9"',
+        'tzdata; platform_system == "Windows"'
     ],
+    extras_require={
+        'fast': ['orjson', 'brotli', 'ciso8601', 'rapidfuzz'],
+        'stream': ['ijson'],
+    },
     python_requires='>=3.7',
 )
 
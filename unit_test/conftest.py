@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Make the project root importable so the tests can import the growfin package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
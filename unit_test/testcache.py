@@ -0,0 +1,179 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from growfin.cache import TTLCache, FileCache
+
+
+class FakeClock:
+    """Stands in for the `time` module in growfin.cache; both clocks advance together."""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+
+class TestTTLCache(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = patch("growfin.cache.time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_before_and_after_expiry(self):
+        cache = TTLCache(maxsize=4, ttl=10)
+        cache.set("TCS", 1)
+        self.clock.now += 9.9
+        self.assertEqual(cache.get("TCS"), 1)
+        self.clock.now += 0.1
+        self.assertIsNone(cache.get("TCS"))
+        self.assertEqual(len(cache), 0, "Expired entry should be dropped on access")
+
+    def test_per_entry_ttl_overrides_default(self):
+        cache = TTLCache(maxsize=4, ttl=10)
+        cache.set("short", 1, ttl=1)
+        cache.set("long", 2, ttl=100)
+        self.clock.now += 50
+        self.assertIsNone(cache.get("short"))
+        self.assertEqual(cache.get("long"), 2)
+
+    def test_missing_key_returns_default(self):
+        cache = TTLCache()
+        self.assertEqual(cache.get("missing", "fallback"), "fallback")
+
+    def test_maxsize_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now the least recently used
+        cache.set("c", 3)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_set_existing_key_refreshes_recency(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 10)
+        cache.set("c", 3)
+        self.assertEqual(cache.get("a"), 10)
+        self.assertIsNone(cache.get("b"))
+
+    def test_pop(self):
+        cache = TTLCache(maxsize=4, ttl=10)
+        cache.set("a", 1)
+        self.assertEqual(cache.pop("a"), 1)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.pop("a", "gone"), "gone")
+
+    def test_pop_expired_returns_default(self):
+        cache = TTLCache(maxsize=4, ttl=10)
+        cache.set("a", 1)
+        self.clock.now += 10
+        self.assertIsNone(cache.pop("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_clear(self):
+        cache = TTLCache(maxsize=4, ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+class TestFileCache(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="growfin-test-")
+        self.addCleanup(shutil.rmtree, self.root, True)
+        self.clock = FakeClock()
+        patcher = patch("growfin.cache.time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def cache_files(self):
+        return sorted(name for name in os.listdir(self.root) if name.endswith(".json"))
+
+    def test_round_trip(self):
+        cache = FileCache(self.root)
+        key = ("RELIANCE", 1704079800000, 1704180600000, 1440)
+        value = {"candles": [[1704079800, 1.0, 2.0, 0.5, 1.5, 100]]}
+        cache.set(key, value)
+        self.assertEqual(cache.get(key), value)
+        # A second instance over the same directory sees the entry, as another process would
+        self.assertEqual(FileCache(self.root).get(key), value)
+
+    def test_missing_key_returns_default(self):
+        self.assertEqual(FileCache(self.root).get("missing", "fallback"), "fallback")
+
+    def test_overwrite_keeps_one_file(self):
+        cache = FileCache(self.root)
+        cache.set("k", 1)
+        cache.set("k", 2)
+        self.assertEqual(cache.get("k"), 2)
+        self.assertEqual(len(self.cache_files()), 1)
+
+    def test_expiry_removes_file(self):
+        cache = FileCache(self.root, ttl=60)
+        cache.set("k", 1)
+        self.clock.now += 59
+        self.assertEqual(cache.get("k"), 1)
+        self.clock.now += 1
+        self.assertIsNone(cache.get("k"))
+        self.assertEqual(self.cache_files(), [])
+
+    def test_no_ttl_keeps_entry(self):
+        cache = FileCache(self.root)
+        cache.set("k", 1)
+        self.clock.now += 10 ** 9
+        self.assertEqual(cache.get("k"), 1)
+
+    def test_unreadable_file_is_a_miss(self):
+        cache = FileCache(self.root)
+        cache.set("k", 1)
+        with open(os.path.join(self.root, self.cache_files()[0]), "w") as f:
+            f.write("{not json")
+        self.assertIsNone(cache.get("k"))
+        self.assertEqual(self.cache_files(), [])
+
+    def test_unserialisable_value_is_not_stored(self):
+        cache = FileCache(self.root)
+        cache.set("k", object())
+        self.assertIsNone(cache.get("k"))
+        self.assertEqual(os.listdir(self.root), [], "No partial or temporary file should remain")
+
+    def test_prune_drops_oldest_files(self):
+        # Each entry is a few dozen bytes; room for roughly five of them
+        cache = FileCache(self.root, max_bytes=250)
+        for i in range(20):
+            cache.set(("k", i), {"i": i})
+            path = cache._path(("k", i))
+            # Distinct write times, oldest first, independent of filesystem timestamp resolution
+            os.utime(path, (i, i))
+
+        total = sum(os.path.getsize(os.path.join(self.root, name)) for name in self.cache_files())
+        self.assertLessEqual(total, 250)
+        self.assertEqual(cache.get(("k", 19)), {"i": 19})
+        self.assertIsNone(cache.get(("k", 0)))
+
+    def test_clear(self):
+        cache = FileCache(self.root)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.clear()
+        self.assertEqual(self.cache_files(), [])
+        self.assertIsNone(cache.get("a"))
+
+
+if __name__ == "__main__":
+    unittest.main()
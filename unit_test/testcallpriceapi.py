@@ -1,10 +1,6 @@
 import unittest
 from unittest.mock import patch, Mock
-import os
-import sys
-# Add the parent directory (project root) to sys.path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from api import call_price_api
+from growfin.api import call_price_api
 
 class TestCallPriceApi(unittest.TestCase):
 
@@ -1,16 +1,11 @@
 import unittest
 from datetime import datetime
-from unittest.mock import patch,MagicMock
-import os
-import sys
+from unittest.mock import patch
 
-import pytz
-# Add parent directory to sys.path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-from utils import convert_to_unixtimestamp 
-from utils import DateTimeValidationError
-from utils import _resolve_timezone  # Adjust if your file is named differently
+from growfin.utils import convert_to_unixtimestamp 
+from growfin.utils import DateTimeValidationError
+from growfin.utils import _resolve_timezone, _named_timezone, _ist_strings_to_unix_ms
+from growfin.utils import ZoneInfo, ZoneInfoNotFoundError
 
 class TestConvertToUnixTimestamp(unittest.TestCase):
     
@@ -53,57 +48,89 @@ class TestConvertToUnixTimestamp(unittest.TestCase):
 
     def test_timezone_aware_datetime(self):
         dt = datetime.strptime("2024-01-01 12:00", "%Y-%m-%d %H:%M")
-        aware_dt = pytz.timezone("Asia/Kolkata").localize(dt)
+        aware_dt = dt.replace(tzinfo=ZoneInfo("Asia/Kolkata"))
         ts = convert_to_unixtimestamp(aware_dt.strftime('%Y-%m-%d %H:%M'), "Asia/Kolkata")
         self.assertIsInstance(ts, int)
 
     def test_localization_failure(self):
-        with patch("your_module._resolve_timezone") as mock_resolve:
-            tz = pytz.timezone("UTC")
-            mock_resolve.return_value = tz
-
-            with patch("pytz.tzinfo.BaseTzInfo.localize", side_effect=Exception("Localization error")):
-                with self.assertRaises(Exception):
-                    convert_to_unixtimestamp("2024-01-01 12:00", "UTC")
+        # _named_timezone is lru_cached, so a previously built zone would skip the patch
+        _named_timezone.cache_clear()
+        self.addCleanup(_named_timezone.cache_clear)
+        with patch("growfin.utils.ZoneInfo", side_effect=Exception("Localization error")):
+            with self.assertRaises(Exception):
+                convert_to_unixtimestamp("2024-01-01 12:00", "UTC")
 
 
 class TestMonkeyPatchingConvertToUnixTimestamp(unittest.TestCase):
 
     def test_monkey_patch_strptime_returns_none(self):
-        with patch("your_module.datetime.strptime", return_value=None):
-            with self.assertRaises(AttributeError):
-                convert_to_unixtimestamp("2024-01-01 12:00")
+        # Without ciso8601 so the parse goes through the patched strptime
+        with patch("growfin.utils._parse_iso", None):
+            with patch("growfin.utils.datetime") as mock_datetime:
+                mock_datetime.strptime.return_value = None
+                with self.assertRaises(AttributeError):
+                    convert_to_unixtimestamp("2024-01-01 12:00")
 
     def test_monkey_patch_get_localzone_none(self):
-        with patch("your_module.tzlocal.get_localzone", return_value=None):
+        with patch("growfin.utils.tzlocal.get_localzone", return_value=None):
             with self.assertRaises(ValueError):
                 convert_to_unixtimestamp("2024-01-01 12:00", None)
 
-    def test_monkey_patch_pytz_timezone_raises(self):
-        with patch("your_module.pytz.timezone", side_effect=pytz.UnknownTimeZoneError):
+    def test_monkey_patch_zoneinfo_raises(self):
+        _named_timezone.cache_clear()
+        self.addCleanup(_named_timezone.cache_clear)
+        with patch("growfin.utils.ZoneInfo", side_effect=ZoneInfoNotFoundError("Fake/Zone")):
             with self.assertRaises(ValueError):
                 convert_to_unixtimestamp("2024-01-01 12:00", "Fake/Zone")
 
     def test_monkey_patch_timestamp_failure(self):
-        mock_dt = MagicMock()
-        mock_dt.timestamp.side_effect = Exception("Failed to get timestamp")
-
-        with patch("your_module.datetime.strptime", return_value=datetime(2024, 1, 1, 12, 0)):
-            with patch("your_module._resolve_timezone", return_value=pytz.timezone("UTC")):
-                with patch("your_module.pytz.timezone", return_value=pytz.timezone("UTC")):
-                    with patch("your_module.pytz.timezone('UTC').localize", return_value=mock_dt):
-                        with self.assertRaises(Exception):
-                            convert_to_unixtimestamp("2024-01-01 12:00", "UTC")
-
+        # A naive epoch cannot be subtracted from the localized datetime
+        with patch("growfin.utils._resolve_timezone", return_value=ZoneInfo("UTC")):
+            with patch("growfin.utils._EPOCH_UTC", datetime(1970, 1, 1)):
+                with self.assertRaises(TypeError):
+                    convert_to_unixtimestamp("2024-01-01 12:00", "UTC")
 
-    def test_monkey_patch_localize_exception(self):
-        with patch("your_module._resolve_timezone") as mock_resolve:
-            mock_tz = MagicMock()
-            mock_tz.localize.side_effect = Exception("Localization fail")
-            mock_resolve.return_value = mock_tz
 
-            with self.assertRaises(Exception):
-                convert_to_unixtimestamp("2024-01-01 12:00", "Asia/Kolkata")
+    def test_monkey_patch_zoneinfo_replaces_tzinfo(self):
+        # zoneinfo zones have no localize(); the naive time is tagged with the zone
+        with patch("growfin.utils._resolve_timezone", return_value=ZoneInfo("Asia/Kolkata")):
+            ts = convert_to_unixtimestamp("2024-01-01 12:00", "Asia/Kolkata")
+        # 12:00 IST is 06:30 UTC
+        self.assertEqual(ts, 1704090600000)
+
+
+class TestIstStringsToUnixMs(unittest.TestCase):
+    """The vectorised batch conversion must match convert_to_unixtimestamp(..., 'Asia/Kolkata')."""
+
+    BATCHES = (
+        # Month, year and leap-day boundaries, plus the IST midnight/UTC previous-day edge
+        {"start": "2023-12-31 00:00", "end": "2023-12-31 23:59"},
+        {"start": "2023-12-31 23:59", "end": "2024-01-01 00:01"},
+        {"start": "2024-01-31 09:15", "end": "2024-02-01 15:30"},
+        {"start": "2024-02-28 22:00", "end": "2024-02-29 05:29"},
+        {"start": "2024-02-29 05:30", "end": "2024-03-01 00:00"},
+        {"start": "2024-06-30 23:45", "end": "2024-07-01 00:15"},
+        {"start": "1970-01-01 05:30", "end": "2038-01-19 08:44"},
+    )
+
+    def test_matches_convert_to_unixtimestamp(self):
+        starts, ends = _ist_strings_to_unix_ms(list(self.BATCHES))
+        for batch, start, end in zip(self.BATCHES, starts, ends):
+            with self.subTest(batch=batch):
+                self.assertEqual(start, convert_to_unixtimestamp(batch["start"], "Asia/Kolkata"))
+                self.assertEqual(end, convert_to_unixtimestamp(batch["end"], "Asia/Kolkata"))
+                self.assertIsInstance(start, int)
+
+    def test_single_batch(self):
+        starts, ends = _ist_strings_to_unix_ms([self.BATCHES[0]])
+        self.assertEqual(len(starts), 1)
+        self.assertEqual(len(ends), 1)
+
+    def test_malformed_string_raises_value_error(self):
+        for bad in ("2024-02-30 10:00", "01-01-2024 12:00", "not a date"):
+            with self.subTest(bad=bad):
+                with self.assertRaises(ValueError):
+                    _ist_strings_to_unix_ms([{"start": bad, "end": "2024-01-01 12:00"}])
 
 
 if __name__ == "__main__":
@@ -2,16 +2,10 @@ import unittest
 from datetime import datetime, timedelta
 from unittest.mock import patch
 from io import StringIO
-import os
 import sys
 
-
-# This line is correct and necessary. It adds the project's root folder to the path.
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-# Assuming a standard project structure where 'grow_api' is a source root
-from utils import create_batches, validate_datetime_format
-from constants import BATCH_LIMITS, API_LOOKBACK_LIMITS
+from growfin.utils import create_batches, validate_datetime_format
+from growfin.constants import BATCH_LIMITS, API_LOOKBACK_LIMITS
 
 class TestCreateBatches(unittest.TestCase):
 
@@ -26,7 +20,7 @@ class TestCreateBatches(unittest.TestCase):
         max_days_per_batch = BATCH_LIMITS[interval]['max_days_per_request']  # 7
         
         mock_now = datetime(2025, 8, 31, 15, 0)
-        with patch('utils.datetime') as mock_datetime:
+        with patch('growfin.utils.datetime') as mock_datetime:
             mock_datetime.now.return_value = mock_now
             # Ensure strptime still works for internal calls if any
             mock_datetime.strptime.side_effect = lambda d, f: datetime.strptime(d, f)
@@ -1,73 +1,100 @@
+import os
+import timeit
 import unittest
+import numpy as np
 import pandas as pd
-import os
-import sys
-from pandas.testing import assert_frame_equal
+from pandas.testing import assert_frame_equal, assert_index_equal, assert_series_equal
+
+from growfin.utils import data_to_dataframe
+
+
+EXPECTED_COLUMNS = ('unix_timestamp', 'time_ist', 'open', 'high', 'low', 'close', 'volume')
+VALUE_COLUMNS = EXPECTED_COLUMNS[2:]
+EXPECTED_INDEX = pd.Index(EXPECTED_COLUMNS)
+EXPECTED_VALUE_DTYPES = pd.Series(np.dtype(np.float64), index=list(VALUE_COLUMNS))
 
-# Print to confirm the test file is executing
-print("✅ Running test_utils.py")
+# One immutable candle; bulk payloads repeat this same object ([SAMPLE_ROW] * n), which
+# is safe because data_to_dataframe only reads its input
+SAMPLE_ROW = (1754019900, 630, 635, 625, 629.1, 115278)
 
-# Add parent directory to sys.path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from utils import data_to_dataframe  # Adjust if your file is named differently
+def setUpModule():
+    # Pay pandas' one-off frame/dtype initialisation here rather than in the first test
+    data_to_dataframe({"candles": [SAMPLE_ROW]})
+    data_to_dataframe({"candles": []})
 
 
 class TestDataToDataFrame(unittest.TestCase):
 
-    def test_valid_input(self):
-        """Should return correct DataFrame with 2 rows and proper column types."""
-        data = {
-            "candles": [
-                [1754019900, 630, 635, 625, 629.1, 115278],
-                [1754019960, 628.85, 631.35, 628.35, 630.75, 177106]
-            ]
+    @classmethod
+    def setUpClass(cls):
+        # Shared read-only fixtures; tests that need their own input still build it locally
+        cls.valid_data = {
+            "candles": (
+                SAMPLE_ROW,
+                (1754019960, 628.85, 631.35, 628.35, 630.75, 177106)
+            )
         }
-        df = data_to_dataframe(data)
-
-        self.assertEqual(df.shape, (2, 7), "DataFrame shape mismatch: Expected (2, 7)")
+        cls.empty_data = {"candles": ()}
+        cls.malformed_data = {
+            "candles": (
+                (1754019900, 630, 635),  # too short
+                "not_a_list",            # not a list
+                (1754019960, 628.85, 631.35, 628.35, 630.75, 177106)  # valid
+            )
+        }
+        cls.df_valid = data_to_dataframe(cls.valid_data)
+        # time_ist is naive IST wall time: 1754019900 is 2025-08-01 03:45 UTC
+        cls.expected_valid = pd.DataFrame({
+            "unix_timestamp": [1754019900, 1754019960],
+            "time_ist": pd.to_datetime(["2025-08-01 09:15:00", "2025-08-01 09:16:00"]),
+            "open": [630.0, 628.85],
+            "high": [635.0, 631.35],
+            "low": [625.0, 628.35],
+            "close": [629.1, 630.75],
+            "volume": [115278.0, 177106.0],
+        })
 
-        expected_cols = ['unix_timestamp', 'time_ist', 'open', 'high', 'low', 'close', 'volume']
-        self.assertListEqual(df.columns.tolist(), expected_cols, f"Unexpected columns: {df.columns.tolist()}")
+    def test_valid_input(self):
+        """Should return correct DataFrame with 2 rows and proper column types."""
+        df = self.df_valid
 
-        self.assertEqual(df.loc[0, 'time_ist'].hour, 9, "IST time hour conversion failed")
-        self.assertEqual(df.loc[0, 'time_ist'].minute, 15, "IST time minute conversion failed")
+        # Shape, column order, IST conversion and values in one comparison; the datetime
+        # resolution of time_ist varies across pandas versions, so dtypes are pinned below
+        assert_frame_equal(df, self.expected_valid, check_dtype=False)
 
-        for col in ['open', 'high', 'low', 'close', 'volume']:
-            self.assertTrue(pd.api.types.is_float_dtype(df[col]), f"Column {col} is not float dtype")
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(df['time_ist']), "'time_ist' is not datetime")
+        assert_series_equal(df.dtypes[list(VALUE_COLUMNS)], EXPECTED_VALUE_DTYPES)
 
     def test_empty_candles(self):
-        data = {"candles": []}
-        df = data_to_dataframe(data)
+        df = data_to_dataframe(self.empty_data)
         self.assertTrue(df.empty, "Expected empty DataFrame for empty candles")
-        self.assertListEqual(
-            df.columns.tolist(),
-            ['unix_timestamp', 'time_ist', 'open', 'high', 'low', 'close', 'volume'],
-            "Column names incorrect for empty dataframe"
-        )
+        assert_index_equal(df.columns, EXPECTED_INDEX)
+
+    def assert_rejects(self, input_val):
+        with self.assertRaises(TypeError, msg=f"Expected TypeError for input: {input_val!r}"):
+            data_to_dataframe(input_val)
+
+    def test_invalid_input_none(self):
+        self.assert_rejects(None)
 
-    def test_invalid_input_not_dict(self):
-        invalid_inputs = [None, [], "string", 123]
-        for input_val in invalid_inputs:
-            with self.subTest(input=input_val):
-                df = data_to_dataframe(input_val)
-                self.assertTrue(df.empty, f"Expected empty DataFrame for input: {input_val}")
+    def test_invalid_input_list(self):
+        self.assert_rejects([])
+
+    def test_invalid_input_string(self):
+        self.assert_rejects("string")
+
+    def test_invalid_input_integer(self):
+        self.assert_rejects(123)
 
     def test_missing_candles_key(self):
         data = {"foo": "bar"}
-        df = data_to_dataframe(data)
-        self.assertTrue(df.empty, "Expected empty DataFrame when 'candles' key is missing")
+        with self.assertRaises(KeyError, msg="Expected KeyError when 'candles' key is missing"):
+            data_to_dataframe(data)
 
     def test_malformed_candle_row(self):
-        malformed = {
-            "candles": [
-                [1754019900, 630, 635],  # too short
-                "not_a_list",            # not a list
-                [1754019960, 628.85, 631.35, 628.35, 630.75, 177106]  # valid
-            ]
-        }
         try:
-            df = data_to_dataframe(malformed)
+            df = data_to_dataframe(self.malformed_data)
             self.assertEqual(len(df), 1, "Only valid row should be included")
         except Exception as e:
             self.fail(f"Function should handle malformed input without throwing. Error: {e}")
@@ -79,9 +106,11 @@ class TestDataToDataFrame(unittest.TestCase):
             ]
         }
         df = data_to_dataframe(data)
-        self.assertTrue(pd.isna(df.loc[0, 'high']), "Non-numeric 'high' should be NaN")
-        self.assertTrue(pd.isna(df.loc[0, 'volume']), "Non-numeric 'volume' should be NaN")
-        self.assertEqual(df.loc[0, 'open'], 630.0, "Open value did not convert correctly")
+        # Numeric strings convert, non-numeric 'high' and 'volume' become NaN
+        np.testing.assert_array_equal(
+            df.loc[0, list(VALUE_COLUMNS)].to_numpy(dtype=np.float64),
+            np.array([630.0, np.nan, 625.0, 629.1, np.nan])
+        )
 
     def test_missing_fields_in_row(self):
         data = {
@@ -90,7 +119,11 @@ class TestDataToDataFrame(unittest.TestCase):
             ]
         }
         df = data_to_dataframe(data)
-        self.assertTrue(pd.isna(df.loc[0, 'high']), "Missing value should convert to NaN")
+        # The missing 'high' converts to NaN, the rest of the row is kept
+        np.testing.assert_array_equal(
+            df.loc[0, list(VALUE_COLUMNS)].to_numpy(dtype=np.float64),
+            np.array([630.0, np.nan, 625.0, 629.1, 115278.0])
+        )
 
     def test_column_order_and_types(self):
         data = {
@@ -99,13 +132,19 @@ class TestDataToDataFrame(unittest.TestCase):
             ]
         }
         df = data_to_dataframe(data)
-        self.assertListEqual(
-            df.columns.tolist(),
-            ['unix_timestamp', 'time_ist', 'open', 'high', 'low', 'close', 'volume'],
-            "Column order is incorrect"
-        )
+        assert_index_equal(df.columns, EXPECTED_INDEX)
         self.assertTrue(pd.api.types.is_datetime64_any_dtype(df['time_ist']), "'time_ist' is not datetime")
 
+    @unittest.skipUnless(os.environ.get("GROWFIN_PERF"), "timing test; set GROWFIN_PERF=1 to run")
+    def test_scaling_is_subquadratic(self):
+        """Guards against a quadratic regression: 100x the rows must cost far less than 10_000x the time."""
+        def best_time(rows):
+            data = {"candles": [SAMPLE_ROW] * rows}
+            return min(timeit.repeat(lambda: data_to_dataframe(data), number=1, repeat=3))
+
+        small, large = best_time(1_000), best_time(100_000)
+        self.assertLess(large / small, 1000, f"1k rows: {small:.4f}s, 100k rows: {large:.4f}s")
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,43 @@
+import unittest
+
+from growfin.utils_info import _extract_content, _dig, _CONTENT_PATHS
+
+
+def walk_content_paths(response):
+    """Reference lookup: the first non-empty content along _CONTENT_PATHS."""
+    for path in _CONTENT_PATHS:
+        content = _dig(response, path)
+        if content:
+            return content, path
+    return None, None
+
+
+# Search envelopes covering every path, empty levels and non-dict levels
+RESPONSES = (
+    {"data": {"data": {"content": [1]}}},
+    {"data": {"data": {"content": []}, "content": [2]}},
+    {"data": {"content": [3]}, "content": [4]},
+    {"data": None, "content": [5]},
+    {"data": [1], "content": [6]},
+    {"data": {"data": 5, "content": None}, "content": [7]},
+    {"data": {"data": {"content": None}}},
+    {"data": None, "debug_info": None, "error": ["failed"]},
+    {},
+)
+
+
+class TestExtractContent(unittest.TestCase):
+
+    def test_matches_content_paths(self):
+        for response in RESPONSES:
+            with self.subTest(response=response):
+                self.assertEqual(_extract_content(response), walk_content_paths(response))
+
+    def test_returns_known_path(self):
+        content, path = _extract_content({"data": {"content": [3]}})
+        self.assertEqual(content, [3])
+        self.assertIn(path, _CONTENT_PATHS)
+
+
+if __name__ == "__main__":
+    unittest.main()
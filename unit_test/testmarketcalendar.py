@@ -0,0 +1,128 @@
+import importlib
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date, datetime, timezone
+from unittest.mock import patch
+
+from growfin import market_calendar
+
+
+def frozen_datetime(instant):
+    """A datetime subclass whose now(tz) is the aware `instant`, for patching market_calendar.datetime."""
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return instant.astimezone(tz)
+    return FrozenDatetime
+
+
+class TestTodayIst(unittest.TestCase):
+
+    def test_date_rolls_over_at_ist_midnight(self):
+        # 20:00 UTC on Jan 1 is already 01:30 on Jan 2 in IST
+        instant = datetime(2024, 1, 1, 20, 0, tzinfo=timezone.utc)
+        with patch("growfin.market_calendar.datetime", frozen_datetime(instant)):
+            self.assertEqual(market_calendar.today_ist(), date(2024, 1, 2))
+
+    def test_same_date_before_ist_midnight(self):
+        # 18:00 UTC is 23:30 IST, still the same day
+        instant = datetime(2024, 1, 1, 18, 0, tzinfo=timezone.utc)
+        with patch("growfin.market_calendar.datetime", frozen_datetime(instant)):
+            self.assertEqual(market_calendar.today_ist(), date(2024, 1, 1))
+
+
+class TestTradingDays(unittest.TestCase):
+
+    def test_listed_holiday(self):
+        republic_day = date(2024, 1, 26)  # Friday
+        self.assertTrue(market_calendar.is_holiday(republic_day))
+        self.assertFalse(market_calendar.is_trading_day(republic_day))
+
+    def test_regular_weekday(self):
+        day = date(2024, 1, 25)  # Thursday
+        self.assertFalse(market_calendar.is_holiday(day))
+        self.assertTrue(market_calendar.is_trading_day(day))
+
+    def test_weekend_is_not_a_trading_day(self):
+        saturday = date(2024, 1, 27)
+        self.assertFalse(market_calendar.is_holiday(saturday))
+        self.assertFalse(market_calendar.is_trading_day(saturday))
+
+    def test_every_shipped_year_is_covered(self):
+        for year, days in market_calendar._NSE_HOLIDAYS_BY_YEAR.items():
+            with self.subTest(year=year):
+                self.assertTrue(days, "A shipped year should list its holidays")
+                self.assertTrue(all(day.year == year for day in days))
+                self.assertLessEqual(year, market_calendar.LAST_COVERED_YEAR)
+
+
+class TestCoverageWarning(unittest.TestCase):
+
+    def setUp(self):
+        patcher = patch.object(market_calendar, "_warned_years", set())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_warns_once_per_uncovered_year(self):
+        uncovered = market_calendar.LAST_COVERED_YEAR + 1
+        with self.assertLogs("growfin.market_calendar", level="WARNING") as logs:
+            market_calendar.is_trading_day(date(uncovered, 3, 2))
+            market_calendar.is_holiday(date(uncovered, 3, 3))
+            market_calendar.is_trading_day(date(uncovered + 1, 3, 2))
+        self.assertEqual(len(logs.records), 2)
+        self.assertIn(str(uncovered), logs.output[0])
+        self.assertIn(str(uncovered + 1), logs.output[1])
+
+    def test_covered_year_does_not_warn(self):
+        with patch.object(market_calendar.logger, "warning") as warning:
+            market_calendar.is_trading_day(date(market_calendar.LAST_COVERED_YEAR, 3, 2))
+        warning.assert_not_called()
+
+
+class TestExtraHolidaysFile(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="growfin-test-")
+        self.addCleanup(shutil.rmtree, self.root, True)
+
+    def write_json(self, name, payload):
+        path = os.path.join(self.root, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(payload if isinstance(payload, str) else json.dumps(payload))
+        return path
+
+    def reload_with(self, path):
+        """Re-import market_calendar as if GROWFIN_HOLIDAYS_JSON named `path`, restoring it afterwards."""
+        patcher = patch("growfin.constants.HOLIDAYS_FILE_PATH", path)
+        patcher.start()
+        self.addCleanup(importlib.reload, market_calendar)
+        self.addCleanup(patcher.stop)
+        importlib.reload(market_calendar)
+
+    def test_extra_dates_are_merged(self):
+        newest = market_calendar.LAST_COVERED_YEAR
+        extra = date(newest + 1, 1, 26)
+        self.reload_with(self.write_json("holidays.json", [extra.isoformat()]))
+
+        self.assertTrue(market_calendar.is_holiday(extra))
+        # The shipped calendar is still in place, and coverage extends to the extra year
+        self.assertTrue(market_calendar.is_holiday(date(2024, 1, 26)))
+        self.assertEqual(market_calendar.LAST_COVERED_YEAR, newest + 1)
+
+    def test_invalid_file_adds_nothing(self):
+        for payload in ("{not json", '["2024-13-01"]', '{"2024": 1}'):
+            with self.subTest(payload=payload):
+                path = self.write_json("bad.json", payload)
+                self.assertEqual(market_calendar._load_extra_holidays(path), frozenset())
+
+    def test_missing_file_adds_nothing(self):
+        missing = os.path.join(self.root, "missing.json")
+        self.assertEqual(market_calendar._load_extra_holidays(missing), frozenset())
+        self.assertEqual(market_calendar._load_extra_holidays(None), frozenset())
+
+
+if __name__ == "__main__":
+    unittest.main()
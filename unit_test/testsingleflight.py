@@ -0,0 +1,100 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from growfin import api
+from growfin.api import _single_flight, call_nse_api
+
+CALLERS = 8
+# Time the first request stays on the wire so every other caller joins it
+JOIN_WINDOW = 0.2
+
+
+class BlockingSession:
+    """Session stub whose get() blocks until released and counts the requests made."""
+
+    def __init__(self, content):
+        self.content = content
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, timeout=None):
+        with self._lock:
+            self.calls += 1
+        self.started.set()
+        self.release.wait(5)
+        return Mock(content=self.content, status_code=200, raise_for_status=Mock())
+
+
+def run_concurrently(func, count):
+    """Start `count` calls of func() together; return (futures, executor)."""
+    executor = ThreadPoolExecutor(max_workers=count)
+    barrier = threading.Barrier(count)
+
+    def call():
+        barrier.wait()
+        return func()
+
+    return [executor.submit(call) for _ in range(count)], executor
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def setUp(self):
+        api.clear_api_cache()
+        self.addCleanup(api.clear_api_cache)
+
+    def test_concurrent_callers_share_one_request(self):
+        session = BlockingSession(b'{"data": {"content": [{"nse_scrip_code": "TCS"}]}}')
+        with patch("growfin.api._get_session", return_value=session):
+            futures, executor = run_concurrently(lambda: call_nse_api("TCS"), CALLERS)
+            self.assertTrue(session.started.wait(5))
+            time.sleep(JOIN_WINDOW)
+            session.release.set()
+            results = [future.result(5) for future in futures]
+            executor.shutdown()
+
+        self.assertEqual(session.calls, 1)
+        for result in results:
+            self.assertIsNone(result["error"])
+            self.assertEqual(result["data"]["data"]["content"], [{"nse_scrip_code": "TCS"}])
+        # Each caller gets its own envelope, not the shared one
+        self.assertEqual(len({id(result) for result in results}), CALLERS)
+        self.assertEqual(api._inflight, {})
+
+    def test_exception_reaches_every_waiter(self):
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def failing_call():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            raise RuntimeError("boom")
+
+        futures, executor = run_concurrently(lambda: _single_flight(("test", "boom"), failing_call), CALLERS)
+        self.assertTrue(started.wait(5))
+        time.sleep(JOIN_WINDOW)
+        release.set()
+        for future in futures:
+            with self.assertRaisesRegex(RuntimeError, "boom"):
+                future.result(5)
+        executor.shutdown()
+
+        self.assertEqual(len(calls), 1)
+        self.assertNotIn(("test", "boom"), api._inflight)
+
+    def test_failed_key_is_retried_by_the_next_caller(self):
+        with self.assertRaises(ValueError):
+            _single_flight(("test", "retry"), Mock(side_effect=ValueError("first")))
+        self.assertEqual(_single_flight(("test", "retry"), lambda: "second"), "second")
+        self.assertNotIn(("test", "retry"), api._inflight)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,30 @@
 import unittest
 from unittest.mock import patch, Mock
-import os
-import sys
 from datetime import datetime
-# Add the parent directory (project root) to sys.path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from utils import validate_datetime_format
-from utils import DateTimeValidationError
+from growfin.utils import validate_datetime_format
+from growfin.utils import DateTimeValidationError
+
+# Monkey testing inputs, built once at import instead of inside the test
+FUZZ_INPUTS = (
+    123,                        # integer
+    12.34,                     # float
+    True,                      # bool
+    None,                      # NoneType
+    "25-12-2023",              # wrong format
+    "2023-13-01",              # invalid month
+    "2023-00-01",              # invalid month
+    "2023-12-32",              # invalid day
+    "2023-02-29",              # non-leap year
+    "abcd-ef-gh",              # alphabets
+    "",                        # empty string
+    "2023-05-10 ",             # trailing space
+    " 2023-05-10",             # leading space
+    "2023-5-1",                # single digit month/day
+    "-1000-01-01",             # negative year
+    "0000-00-00",              # invalid zero date
+    [], {}, (), object(),     # other types
+)
+INVALID_INPUT_ERRORS = (TypeError, DateTimeValidationError)
 
 class TestValidateDatetimeFormat(unittest.TestCase):
 
@@ -56,29 +74,9 @@ class TestValidateDatetimeFormat(unittest.TestCase):
     # Monkey Testing 
 
     def test_fuzz_inputs(self):
-        test_inputs = [
-            123,                        # integer
-            12.34,                     # float
-            True,                      # bool
-            None,                      # NoneType
-            "25-12-2023",              # wrong format
-            "2023-13-01",              # invalid month
-            "2023-00-01",              # invalid month
-            "2023-12-32",              # invalid day
-            "2023-02-29",              # non-leap year
-            "abcd-ef-gh",              # alphabets
-            "",                        # empty string
-            "2023-05-10 ",             # trailing space
-            " 2023-05-10",             # leading space
-            "2023-5-1",                # single digit month/day   
-            "-1000-01-01",             # negative year
-            "0000-00-00",              # invalid zero date
-            [], {}, (), object(),     # other types
-        ]
-
-        for input_val in test_inputs:
+        for input_val in FUZZ_INPUTS:
             with self.subTest(input_val=input_val):
-                with self.assertRaises((TypeError, DateTimeValidationError)):
+                with self.assertRaises(INVALID_INPUT_ERRORS):
                     validate_datetime_format(input_val)
 
 if __name__ == '__main__':